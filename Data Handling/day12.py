@@ -30,13 +30,302 @@ Bonus:
 
 import csv
 import os
+import sys
+import time
+import random
+import tempfile
+from types import SimpleNamespace
+from contextlib import contextmanager
+
+import numpy as np
 
 FILENAME = "contacts.csv"
 
-if not os.path.exists(FILENAME):
-    with open(FILENAME, "w", newline="", encoding="utf-8") as f:
+# Lowercased name -> byte offset of its row, kept in step with contacts.csv.
+# indexed_size is how far into the file the index has read, so rows
+# appended by another program are picked up by scanning only the new tail.
+name_index = {}
+indexed_size = 0
+
+# Columns searched through the trigram index; add 1 (Phone) and/or 2 (Email)
+# to search those too. The index is rebuilt when this changes.
+TRIGRAM_COLUMNS = (0,)
+TRIGRAM_FLUSH = 50_000  # rows added since the last save before re-saving
+FUZZY_CHECKS = 1_000  # most candidates verified for a typo-tolerant search
+IMPORT_BUFFER = 1024 * 1024  # bytes buffered before each write during an import
+trigram_index = None
+
+
+def create_contacts_file():
+    if not os.path.exists(FILENAME):
+        with open(FILENAME, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Name", "Phone", "Email"])
+
+
+create_contacts_file()
+
+
+@contextmanager
+def contacts_file(path):
+    # Point the contact book at another file (benchmarks)
+    global FILENAME, name_index, indexed_size, trigram_index
+    saved = FILENAME, name_index, indexed_size, trigram_index
+    FILENAME, name_index, indexed_size, trigram_index = path, {}, 0, None
+    try:
+        create_contacts_file()
+        yield
+    finally:
+        FILENAME, name_index, indexed_size, trigram_index = saved
+
+
+def read_rows(start=0):
+    # Yields (byte offset, row) for each contact from byte `start` on,
+    # skipping the header. Returns the offset where reading stopped.
+    position = start
+    with open(FILENAME, "rb") as f:
+        f.seek(start)
+
+        def lines():
+            nonlocal position
+            for line in f:
+                position += len(line)
+                yield line.decode("utf-8")
+
+        reader = csv.reader(lines())
+        row_start = position
+        for row in reader:
+            if row and row_start > 0:
+                yield row_start, row
+            row_start = position
+    return position
+
+
+def refresh_name_index():
+    # One full scan the first time, then only what was appended since
+    global indexed_size
+    size = os.path.getsize(FILENAME)
+    if size < indexed_size:
+        name_index.clear()
+        indexed_size = 0
+    if size != indexed_size:
+        rows = read_rows(indexed_size)
+        while True:
+            try:
+                offset, row = next(rows)
+            except StopIteration as done:
+                indexed_size = done.value
+                break
+            name_index.setdefault(row[0].lower(), offset)
+    return name_index
+
+
+def trigram_file():
+    return os.path.splitext(FILENAME)[0] + "_trigrams.npz"
+
+
+def trigrams(text):
+    # "$$" marks the start and "$" the end, so every letter, even in a one-
+    # or two-letter field, sits inside at least one trigram
+    text = f"$${text.lower()}$"
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def row_trigrams(row):
+    grams = set()
+    for column in TRIGRAM_COLUMNS:
+        if column < len(row):
+            grams |= trigrams(row[column])
+    return grams
+
+
+def empty_trigram_index():
+    # Saved part: gram -> postings[starts[id]:starts[id + 1]] (row numbers,
+    # ascending) and row number -> byte offset. Rows added since the last
+    # save live in `extra` and `extra_offsets` until the next save.
+    return {
+        "grams": {}, "starts": np.zeros(1, dtype=np.int64), "postings": np.zeros(0, dtype=np.int32),
+        "offsets": np.zeros(0, dtype=np.int64), "extra": {}, "extra_offsets": [], "size": 0,
+    }
+
+
+def index_row(index, offset, row):
+    row_id = len(index["offsets"]) + len(index["extra_offsets"])
+    index["extra_offsets"].append(offset)
+    for gram in row_trigrams(row):
+        index["extra"].setdefault(gram, []).append(row_id)
+
+
+def index_new_rows(index):
+    rows = read_rows(index["size"])
+    while True:
+        try:
+            offset, row = next(rows)
+        except StopIteration as done:
+            index["size"] = done.value
+            return
+        index_row(index, offset, row)
+
+
+def save_trigram_index(index):
+    # Folds the extra rows into the sorted arrays and writes them atomically
+    grams = list(index["grams"])
+    gram_ids = {gram: i for i, gram in enumerate(grams)}
+    for gram in index["extra"]:
+        if gram not in gram_ids:
+            gram_ids[gram] = len(grams)
+            grams.append(gram)
+    old_ids = np.repeat(np.arange(len(index["grams"]), dtype=np.int32), np.diff(index["starts"]))
+    extra_ids = np.fromiter((gram_ids[gram] for gram, rows in index["extra"].items() for _ in rows), dtype=np.int32)
+    extra_rows = np.fromiter((row for rows in index["extra"].values() for row in rows), dtype=np.int32)
+    ids = np.concatenate([old_ids, extra_ids])
+    order = np.argsort(ids, kind="stable")  # stable keeps each posting list ascending
+
+    index["grams"] = gram_ids
+    index["starts"] = np.concatenate([[0], np.cumsum(np.bincount(ids, minlength=len(grams)))])
+    index["postings"] = np.concatenate([index["postings"], extra_rows])[order]
+    index["offsets"] = np.concatenate([index["offsets"], np.array(index["extra_offsets"], dtype=np.int64)])
+    index["extra"], index["extra_offsets"] = {}, []
+
+    temp_file = trigram_file() + ".tmp.npz"
+    np.savez(temp_file, grams=np.array(grams, dtype=str), starts=index["starts"], postings=index["postings"],
+             offsets=index["offsets"], size=index["size"], columns=np.array(TRIGRAM_COLUMNS))
+    os.replace(temp_file, trigram_file())
+
+
+def load_trigram_index():
+    # Loads the saved index and indexes only rows appended after it was saved;
+    # a missing, shrunken-file or different-columns index is rebuilt once
+    size = os.path.getsize(FILENAME)
+    index = empty_trigram_index()
+    if os.path.exists(trigram_file()):
+        with np.load(trigram_file()) as saved:
+            if int(saved["size"]) <= size and tuple(saved["columns"].tolist()) == TRIGRAM_COLUMNS:
+                index["grams"] = {gram: i for i, gram in enumerate(saved["grams"].tolist())}
+                index["starts"], index["postings"] = saved["starts"], saved["postings"]
+                index["offsets"], index["size"] = saved["offsets"], int(saved["size"])
+    index_new_rows(index)
+    if len(index["extra_offsets"]) >= TRIGRAM_FLUSH or not os.path.exists(trigram_file()):
+        save_trigram_index(index)
+    return index
+
+
+def refresh_trigram_index():
+    global trigram_index
+    if trigram_index is None or os.path.getsize(FILENAME) < trigram_index["size"]:
+        trigram_index = load_trigram_index()
+    elif os.path.getsize(FILENAME) != trigram_index["size"]:
+        index_new_rows(trigram_index)
+    return trigram_index
+
+
+def postings(index, gram):
+    found = index["grams"].get(gram)
+    saved = index["postings"][index["starts"][found]:index["starts"][found + 1]] if found is not None else None
+    extra = index["extra"].get(gram)
+    if extra is None:
+        return saved if saved is not None else np.zeros(0, dtype=np.int32)
+    extra = np.array(extra, dtype=np.int32)
+    return extra if saved is None else np.concatenate([saved, extra])
+
+
+def row_offset(index, row_id):
+    saved = len(index["offsets"])
+    return int(index["offsets"][row_id]) if row_id < saved else index["extra_offsets"][row_id - saved]
+
+
+def contains(sorted_rows, rows):
+    # Which of rows appear in the ascending posting list sorted_rows
+    at = np.searchsorted(sorted_rows, rows)
+    return sorted_rows[np.minimum(at, len(sorted_rows) - 1)] == rows if len(sorted_rows) else at < 0
+
+
+def fuzzy_distance(pattern, text):
+    # Fewest edits turning pattern into some substring of text
+    previous = [0] * (len(text) + 1)
+    for i, letter in enumerate(pattern, 1):
+        current = [i]
+        for j, other in enumerate(text, 1):
+            current.append(min(previous[j - 1] + (letter != other), previous[j] + 1, current[j - 1] + 1))
+        previous = current
+    return min(previous)
+
+
+def search_contacts(term, typos=0, limit=20):
+    # Substring search on the indexed columns; limit=None returns every
+    # match. Only rows sharing the term's trigrams are read from disk.
+    # With typos > 0, rows within that many edits also match, closest first.
+    term = term.strip().lower()
+    if not term:
+        return []
+    index = refresh_trigram_index()
+    short = len(term) < 3
+    if short:
+        # One or two letters: every row holding them has some indexed
+        # trigram that contains them, so take the union of those lists
+        grams = {gram for gram in index["grams"] if term in gram}
+        grams.update(gram for gram in index["extra"] if term in gram)
+        hits = np.zeros(len(index["offsets"]) + len(index["extra_offsets"]), dtype=bool)
+        for gram in grams:
+            hits[postings(index, gram)] = True
+        lists = [np.flatnonzero(hits)]
+    else:
+        grams = list(dict.fromkeys(term[i:i + 3] for i in range(len(term) - 2)))
+        lists = sorted((postings(index, gram) for gram in grams), key=len)
+
+    if typos and not short:
+        # Each edit spoils at most three of the term's trigrams, so a match
+        # holds at least `needed` of them and must be in one of the
+        # len(lists) - needed + 1 shortest posting lists
+        needed = max(1, len(grams) - 3 * typos)
+        candidates = np.unique(np.concatenate(lists[:len(lists) - needed + 1]))
+        counts = sum(contains(other, candidates).astype(np.int32) for other in lists)
+        candidates = candidates[counts >= needed]
+        candidates = candidates[np.argsort(-counts[counts >= needed], kind="stable")][:FUZZY_CHECKS]
+    else:
+        candidates = lists[0]
+        for other in lists[1:]:
+            candidates = candidates[contains(other, candidates)]
+
+    results = []
+    with open(FILENAME, "rb") as f:
+        for row_id in map(int, candidates):
+            f.seek(row_offset(index, row_id))
+            row = next(csv.reader(line.decode("utf-8") for line in f))
+            fields = [row[column].lower() for column in TRIGRAM_COLUMNS if column < len(row)]
+            if typos and not short:
+                distance = min(fuzzy_distance(term, field) for field in fields)
+                if distance <= typos:
+                    results.append((distance, row))
+            elif any(term in field for field in fields):
+                results.append((0, row))
+                if len(results) == limit:
+                    break
+    results.sort(key=lambda result: result[0])
+    return [row for _, row in results[:limit]]
+
+
+def save_contact(name, phone, email):
+    # False if the name is already taken (case-insensitive)
+    global indexed_size
+    refresh_name_index()
+    if name.lower() in name_index:
+        return False
+    if trigram_index is not None:
+        refresh_trigram_index()
+    with open(FILENAME, 'a', newline="", encoding="utf-8") as f:
+        offset = f.tell()
         writer = csv.writer(f)
-        writer.writerow(["Name", "Phone", "Email"])
+        writer.writerow([name, phone, email])
+        indexed_size = f.tell()
+    name_index[name.lower()] = offset
+    if trigram_index is not None:
+        index_row(trigram_index, offset, [name, phone, email])
+        trigram_index["size"] = indexed_size
+        if len(trigram_index["extra_offsets"]) >= TRIGRAM_FLUSH:
+            save_trigram_index(trigram_index)
+    return True
+
 
 def add_contact():
     name = input("Name: ").strip()
@@ -44,17 +333,92 @@ def add_contact():
     email = input("Email: ").strip()
 
     #check for duplicates
-    with open(FILENAME, 'r', encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-           if row["Name"].lower() == name.lower():
-               print("Contact name already exists")
-               return
-    
-    with open(FILENAME, 'a', encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([name, phone, email])
+    if save_contact(name, phone, email):
         print("Contact added")
+    else:
+        print("Contact name already exists")
+
+
+def read_csv_contacts(f):
+    # (name, phone, email) from a CSV export; columns are found by header
+    reader = csv.reader(f)
+    header = [column.strip().lower() for column in next(reader, [])]
+    if "name" not in header:
+        raise ValueError("The CSV needs a Name column")
+    name_at = header.index("name")
+    phone_at = header.index("phone") if "phone" in header else None
+    email_at = header.index("email") if "email" in header else None
+    for row in reader:
+        if len(row) > name_at:
+            phone = row[phone_at].strip() if phone_at is not None and phone_at < len(row) else ""
+            email = row[email_at].strip() if email_at is not None and email_at < len(row) else ""
+            yield row[name_at].strip(), phone, email
+
+
+def read_vcards(f):
+    # (name, phone, email) per BEGIN:VCARD ... END:VCARD block. Folded lines
+    # are joined, FN is preferred over N, and the first TEL and EMAIL win.
+    card = None
+    lines = iter(f)
+    line = next(lines, None)
+    while line is not None:
+        line = line.rstrip("\r\n")
+        following = next(lines, None)
+        while following is not None and following[:1] in (" ", "\t"):
+            line += following.rstrip("\r\n")[1:]
+            following = next(lines, None)
+
+        key, _, value = line.partition(":")
+        prop = key.split(";", 1)[0].split(".")[-1].strip().upper()
+        value = value.replace("\\,", ",").replace("\\;", ";").strip()
+        if prop == "BEGIN":
+            card = {}
+        elif prop == "END" and card is not None:
+            name = card.get("FN") or " ".join(part for part in reversed(card.get("N", "").split(";")[:2]) if part)
+            yield name.strip(), card.get("TEL", ""), card.get("EMAIL", "")
+            card = None
+        elif card is not None and prop in ("FN", "N", "TEL", "EMAIL"):
+            card.setdefault(prop, value)
+        line = following
+
+
+def import_contacts(path):
+    # One pass over the export: names already in the book or seen earlier in
+    # the same export are skipped, the rest go out in one buffered append.
+    # Returns (inserted, skipped).
+    global indexed_size
+    refresh_name_index()
+    inserted = skipped = 0
+    line_of = csv.writer(SimpleNamespace(write=lambda line: line)).writerow  # row -> CSV line
+    with open(path, "r", newline="", encoding="utf-8-sig") as source, \
+            open(FILENAME, "ab", buffering=IMPORT_BUFFER) as f:
+        contacts = read_vcards(source) if path.lower().endswith((".vcf", ".vcard")) else read_csv_contacts(source)
+        offset = f.tell()
+        if offset:
+            with open(FILENAME, "rb") as last:
+                last.seek(offset - 1)
+                if last.read(1) != b"\n":
+                    offset += f.write(b"\r\n")
+        for name, phone, email in contacts:
+            key = name.lower()
+            if not name or key in name_index:
+                skipped += 1
+                continue
+            name_index[key] = offset
+            offset += f.write(line_of([name, phone, email]).encode("utf-8"))
+            inserted += 1
+    indexed_size = offset
+    return inserted, skipped
+
+
+def import_menu():
+    path = input("Path of the CSV or vCard file to import: ").strip()
+    try:
+        inserted, skipped = import_contacts(path)
+    except (OSError, ValueError) as e:
+        print(f"Could not import: {e}")
+        return
+    print(f"Imported {inserted} contacts, skipped {skipped} duplicates or blank names")
 
 
 def view_contacts():
@@ -74,19 +438,121 @@ def view_contacts():
 
 def search_contact():
     term = input("Enter the name to search: ").strip().lower()
-    found = False
+    matches = search_contacts(term, limit=None)
+    if not matches:
+        matches = search_contacts(term, typos=1, limit=None)
+        if matches:
+            print("No exact match, did you mean:")
 
-    with open(FILENAME, 'r', encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if term in row["Name"].lower():
-                print(f"{row["Name"]} | 📞 {row["Phone"]}")
-                found = True
+    for row in matches:
+        print(f"{row[0]} | 📞 {row[1]}")
 
-    if not found:
+    if not matches:
         print("No matching contact found")
 
 
+def benchmark(inserts=100_000, scan_inserts=2_000):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with contacts_file(os.path.join(tmp_dir, "contacts.csv")):
+            start = time.perf_counter()
+            for i in range(inserts):
+                save_contact(f"Contact {i}", f"98{i:08d}", f"contact{i}@example.com")
+            duplicates = sum(not save_contact(f"contact {i}", "", "") for i in range(0, inserts, 10))
+            elapsed = time.perf_counter() - start
+        print(f"indexed: {inserts:,} inserts + {duplicates:,} duplicates rejected "
+              f"in {elapsed:.1f}s ({elapsed / (inserts + duplicates) * 1e6:.0f} us each)")
+
+        # The old way: DictReader over the whole file before every insert
+        path = os.path.join(tmp_dir, "scan.csv")
+        with contacts_file(path):
+            start = time.perf_counter()
+            for i in range(scan_inserts):
+                with open(path, 'r', encoding="utf-8") as f:
+                    if any(row["Name"].lower() == f"contact {i}" for row in csv.DictReader(f)):
+                        continue
+                with open(path, 'a', newline="", encoding="utf-8") as f:
+                    csv.writer(f).writerow([f"Contact {i}", f"98{i:08d}", f"contact{i}@example.com"])
+            elapsed = time.perf_counter() - start
+        print(f"full scan: {scan_inserts:,} inserts in {elapsed:.1f}s "
+              f"({elapsed / scan_inserts * 1e6:.0f} us each, growing with the file)")
+
+
+def benchmark_search(contacts=2_000_000, queries=200):
+    rng = random.Random(0)
+    first = ["Aarav", "Priya", "Rohan", "Ananya", "Vikram", "Neha", "Arjun", "Kavya", "Ishaan", "Meera",
+             "Kabir", "Diya", "Aditya", "Saanvi", "Rahul", "Pooja", "Siddharth", "Tara", "Yash", "Zoya"]
+    last = ["Sharma", "Verma", "Iyer", "Nair", "Gupta", "Reddy", "Mehta", "Kapoor", "Joshi", "Bose",
+            "Menon", "Chopra", "Malhotra", "Bhat", "Rao", "Das", "Pillai", "Singh", "Khan", "Desai"]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "contacts.csv")
+        with contacts_file(path):
+            sampled = set(rng.sample(range(contacts), min(queries, contacts)))
+            names = []
+            with open(path, "a", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                for i in range(contacts):
+                    name = f"{rng.choice(first)} {rng.choice(last)} {i}"
+                    writer.writerow([name, f"98{i:08d}", f"c{i}@example.com"])
+                    if i in sampled:
+                        names.append(name)
+
+            global trigram_index
+            start = time.perf_counter()
+            refresh_trigram_index()
+            print(f"{contacts:,} contacts: index built and saved in {time.perf_counter() - start:.1f}s")
+            trigram_index = None
+            start = time.perf_counter()
+            refresh_trigram_index()
+            print(f"index loaded from disk in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+            # "riya Sharma 123" style substrings, two-letter substrings, and
+            # the same long substrings with one letter changed
+            terms = [name.split(" ", 1)[0][1:] + " " + name.split(" ", 1)[1] for name in names]
+            for label, typos, queries_for in (
+                ("substring", 0, terms),
+                ("2 letters", 0, [name.split()[1][1:3] for name in names]),
+                ("one typo", 1, [term[:2] + "x" + term[3:] for term in terms]),
+            ):
+                start = time.perf_counter()
+                found = sum(bool(search_contacts(term, typos)) for term in queries_for)
+                elapsed = (time.perf_counter() - start) / len(queries_for) * 1000
+                print(f"{label:>9}: {elapsed:.2f} ms per query, {found}/{len(queries_for)} found")
+
+            start = time.perf_counter()
+            for i in range(10_000):
+                save_contact(f"New Contact {i}", "", "")
+            print(f"10,000 adds with both indexes kept current: {time.perf_counter() - start:.1f}s")
+
+
+def benchmark_import(rows=1_000_000, existing=100_000):
+    # One row in twenty repeats an earlier row, another one in twenty an
+    # existing contact
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        export = os.path.join(tmp_dir, "export.csv")
+        with open(export, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Name", "Phone", "Email"])
+            for i in range(rows):
+                number = i - 7 if i % 20 == 0 and i else -1 - i % existing if i % 20 == 10 else i
+                writer.writerow([f"Contact {number}", f"98{i:08d}", f"contact{i}@example.com"])
+        cards = os.path.join(tmp_dir, "export.vcf")
+        with open(cards, "w", encoding="utf-8") as f:
+            for i in range(rows // 10):
+                f.write(f"BEGIN:VCARD\r\nVERSION:3.0\r\nFN:Card {i}\r\nN:{i};Card;;;\r\n"
+                        f"TEL;TYPE=CELL:+91 98{i:08d}\r\nEMAIL;TYPE=INTERNET:card{i}@example.com\r\nEND:VCARD\r\n")
+
+        with contacts_file(os.path.join(tmp_dir, "contacts.csv")):
+            with open(FILENAME, "a", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                for i in range(-existing, 0):
+                    writer.writerow([f"Contact {i}", "", ""])
+            for label, path in (("CSV", export), ("vCard", cards)):
+                start = time.perf_counter()
+                inserted, skipped = import_contacts(path)
+                elapsed = time.perf_counter() - start
+                print(f"{label}: {inserted + skipped:,} rows ({inserted:,} inserted, {skipped:,} skipped) "
+                      f"in {elapsed:.1f}s")
+
 
 def main():
 
@@ -95,9 +561,10 @@ def main():
         print("1. Add Contact")
         print("2. View All Contacts")
         print("3. Search Contact")
-        print("4. Exit")
+        print("4. Import Contacts")
+        print("5. Exit")
 
-        choice = input("Choose an option (1-4)").strip()
+        choice = input("Choose an option (1-5)").strip()
 
         if choice == "1":
             add_contact()
@@ -106,11 +573,29 @@ def main():
         elif choice == "3":
             search_contact()
         elif choice == "4":
+            import_menu()
+        elif choice == "5":
             print("Thanks for using our software")
+            if trigram_index is not None and trigram_index["extra_offsets"]:
+                save_trigram_index(trigram_index)
             break
         else:
             print("Invalid choice of number")
 
 
 if __name__ == "__main__":
-    main()
+    # python day12.py --bench -> 100k inserts through the name index
+    # python day12.py --bench-search [contacts] -> trigram search over 2M contacts
+    # python day12.py --import export.csv|export.vcf -> bulk import
+    # python day12.py --bench-import [rows] -> 1M-row import
+    if "--bench" in sys.argv:
+        benchmark()
+    elif len(sys.argv) > 2 and sys.argv[1] == "--import":
+        inserted, skipped = import_contacts(sys.argv[2])
+        print(f"Imported {inserted:,} contacts, skipped {skipped:,} duplicates or blank names")
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench-import":
+        benchmark_import(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench-search":
+        benchmark_search(int(sys.argv[2]) if len(sys.argv) > 2 else 2_000_000)
+    else:
+        main()
@@ -17,6 +17,392 @@ Bonus:
 - Prevent duplicate student names
 """
 
+import os
+import sys
+import csv
+import math
+import time
+import random
+import zipfile
+import tempfile
+
+import numpy as np
+
+HISTOGRAM_BINS = 1000  # fixed-width bins over 0-100 for percentiles
+SCORE_RANGE = (0.0, 100.0)  # scores outside it land in the end bins
+TIE_NAMES = 10  # names kept for the highest and lowest score
+GRADES = ((90, "A"), (80, "B"), (70, "C"), (60, "D"), (40, "E"), (-math.inf, "F"))
+CSV_CHUNK = 100_000  # rows converted to arrays at a time
+STORE_COLUMNS = ("student_id", "subject", "section", "score")
+
+
+def new_stats():
+    # Everything is fixed size, so memory stays constant however many
+    # students stream through
+    return {
+        "count": 0, "mean": 0.0, "m2": 0.0,
+        "max": -math.inf, "max_count": 0, "max_names": [],
+        "min": math.inf, "min_count": 0, "min_names": [],
+        "histogram": np.zeros(HISTOGRAM_BINS, dtype=np.int64),
+        "grades": dict.fromkeys([grade for _, grade in GRADES], 0),
+        "skipped": 0,
+    }
+
+
+def grade_of(score):
+    for bound, grade in GRADES:
+        if score >= bound:
+            return grade
+
+
+def bin_of(scores):
+    low, high = SCORE_RANGE
+    bins = ((np.asarray(scores, dtype=np.float64) - low) * (HISTOGRAM_BINS / (high - low))).astype(np.int64)
+    return np.clip(bins, 0, HISTOGRAM_BINS - 1)
+
+
+def note_extreme(stats, key, score, names, count):
+    # New record: start the tie list again; equal score: add to it
+    better = score > stats[key] if key == "max" else score < stats[key]
+    if better:
+        stats[key], stats[key + "_count"], stats[key + "_names"] = score, 0, []
+    if better or score == stats[key]:
+        stats[key + "_count"] += count
+        stats[key + "_names"].extend(names[:TIE_NAMES - len(stats[key + "_names"])])
+
+
+def add_score(stats, name, score):
+    # Welford's update: no sum of squares, so no precision loss on big counts
+    stats["count"] += 1
+    delta = score - stats["mean"]
+    stats["mean"] += delta / stats["count"]
+    stats["m2"] += delta * (score - stats["mean"])
+    note_extreme(stats, "max", score, [name], 1)
+    note_extreme(stats, "min", score, [name], 1)
+    stats["histogram"][bin_of(score)] += 1
+    stats["grades"][grade_of(score)] += 1
+
+
+def add_scores(stats, names, scores):
+    # A whole chunk at once: its own mean and m2 are merged in with the
+    # pairwise form of Welford's update (Chan et al.)
+    scores = np.asarray(scores, dtype=np.float64)
+    if not len(scores):
+        return
+    count = len(scores)
+    mean = float(scores.mean())
+    m2 = float(((scores - mean) ** 2).sum())
+    total = stats["count"] + count
+    delta = mean - stats["mean"]
+    stats["mean"] += delta * count / total
+    stats["m2"] += m2 + delta * delta * stats["count"] * count / total
+    stats["count"] = total
+
+    for key, extreme in (("max", scores.max()), ("min", scores.min())):
+        at = np.flatnonzero(scores == extreme)
+        note_extreme(stats, key, float(extreme), [names[i] for i in at[:TIE_NAMES]], len(at))
+    stats["histogram"] += np.bincount(bin_of(scores), minlength=HISTOGRAM_BINS)
+    # Position in GRADES = how many grade bounds lie above the score
+    above = np.searchsorted(-np.array([bound for bound, _ in GRADES]), -scores, side="left")
+    per_grade = np.bincount(above, minlength=len(GRADES))
+    for (_, grade), graded in zip(GRADES, per_grade.tolist()):
+        stats["grades"][grade] += graded
+
+
+def variance(stats):
+    return stats["m2"] / stats["count"] if stats["count"] else 0.0
+
+
+def percentile(stats, p):
+    # Interpolated inside the fixed-width bin; off by at most one bin width
+    # (0.1 marks by default) and always within the real min and max
+    if not stats["count"]:
+        return None
+    low, high = SCORE_RANGE
+    width = (high - low) / HISTOGRAM_BINS
+    target = p / 100 * stats["count"]
+    cumulative = np.cumsum(stats["histogram"])
+    at = int(np.searchsorted(cumulative, target))
+    at = min(at, HISTOGRAM_BINS - 1)
+    before = cumulative[at - 1] if at else 0
+    inside = stats["histogram"][at]
+    value = low + width * (at + ((target - before) / inside if inside else 0))
+    return min(max(value, stats["min"]), stats["max"])
+
+
+def stream_csv(path, stats=None, name_column="name", score_column="marks", chunk_rows=CSV_CHUNK):
+    # One pass over a results CSV; rows without a usable score are counted
+    # as skipped. Only one chunk of rows is held at a time.
+    stats = stats or new_stats()
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [column.strip().lower() for column in next(reader)]
+        name_at = header.index(name_column)
+        score_at = header.index(score_column) if score_column in header else header.index("score")
+        names, scores = [], []
+        for row in reader:
+            try:
+                score = float(row[score_at])
+            except (ValueError, IndexError):
+                stats["skipped"] += 1
+                continue
+            if not math.isfinite(score):  # "nan" and "inf" parse as floats too
+                stats["skipped"] += 1
+                continue
+            names.append(row[name_at])
+            scores.append(score)
+            if len(scores) == chunk_rows:
+                add_scores(stats, names, scores)
+                names, scores = [], []
+        add_scores(stats, names, scores)
+    return stats
+
+
+def tie_text(stats, key):
+    names = ", ".join(stats[key + "_names"])
+    more = stats[key + "_count"] - len(stats[key + "_names"])
+    return f"{names} and {more:,} more" if more else names
+
+
+def print_stats(stats):
+    print("\n Students marks report 📝")
+    print("-" * 30)
+    print(f"Total students: {stats['count']:,}")
+    if stats["skipped"]:
+        print(f"Rows skipped (no valid marks): {stats['skipped']:,}")
+    if not stats["count"]:
+        return
+    print(f"Average marks for students: {stats['mean']:.2f}")
+    print(f"Standard deviation: {math.sqrt(variance(stats)):.2f}")
+    print(f"Highest marks: {stats['max']} by {tie_text(stats, 'max')}")
+    print(f"Lowest marks: {stats['min']} by {tie_text(stats, 'min')}")
+    print("Percentiles: " + ", ".join(f"p{p}={percentile(stats, p):.1f}" for p in (10, 25, 50, 75, 90, 99)))
+    print("Grades: " + ", ".join(f"{grade}: {count:,}" for grade, count in stats["grades"].items()))
+    print("-" * 30)
+
+
+def benchmark(rows=5_000_000):
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "results.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "marks"])
+            for i in range(rows):
+                writer.writerow([f"Student {i}", round(min(100, max(0, rng.gauss(65, 15))), 1)])
+        start = time.perf_counter()
+        stats = stream_csv(path)
+        elapsed = time.perf_counter() - start
+
+    # Cross-check against a plain two-pass computation on a sample
+    sample = np.array([rng.gauss(65, 15) for _ in range(100_000)])
+    check = new_stats()
+    for i in range(0, len(sample), 7_919):
+        add_scores(check, [""] * len(sample[i:i + 7_919]), sample[i:i + 7_919])
+    assert math.isclose(check["mean"], sample.mean()) and math.isclose(variance(check), sample.var())
+    print_stats(stats)
+    print(f"{rows:,} rows in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/s)")
+
+
+def empty_store():
+    # Columnar marks: one entry per score row. Student IDs, subjects and
+    # sections are stored as small integer codes into the name lists.
+    return {
+        "student": np.zeros(0, dtype=np.int32), "subject": np.zeros(0, dtype=np.int16),
+        "section": np.zeros(0, dtype=np.int16), "score": np.zeros(0, dtype=np.float32),
+        "students": [], "subjects": [], "sections": [], "skipped": 0,
+    }
+
+
+def code_of(codes, names, value):
+    code = codes.get(value)
+    if code is None:
+        code = codes[value] = len(names)
+        names.append(value)
+    return code
+
+
+def read_marks_csv(path, chunk_rows=CSV_CHUNK):
+    # student_id, subject, section, score columns (any order, found by header).
+    # Rows with a missing or unusable score are counted in store["skipped"],
+    # the same way stream_csv() does.
+    store = empty_store()
+    lookups = [{}, {}, {}]
+    columns = {key: [store[key]] for key in ("student", "subject", "section", "score")}
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [column.strip().lower() for column in next(reader)]
+        positions = [header.index(column) for column in STORE_COLUMNS]
+        while True:
+            chunk = [row for _, row in zip(range(chunk_rows), reader)]
+            if not chunk:
+                break
+            rows, scores = [], []
+            for row in chunk:
+                try:
+                    score = float(row[positions[3]])
+                    row[max(positions)]
+                except (ValueError, IndexError):
+                    store["skipped"] += 1
+                    continue
+                if not math.isfinite(score):
+                    store["skipped"] += 1
+                    continue
+                rows.append(row)
+                scores.append(score)
+            for key, names, lookup, at in zip(("student", "subject", "section"),
+                                              ("students", "subjects", "sections"), lookups, positions):
+                columns[key].append(np.array([code_of(lookup, store[names], row[at].strip()) for row in rows],
+                                             dtype=store[key].dtype))
+            columns["score"].append(np.array(scores, dtype=np.float32))
+    for key, parts in columns.items():
+        store[key] = np.concatenate(parts)
+    return store
+
+
+def save_store(store, path, source_stamp=()):
+    # Written to a temporary file and swapped in, so a crash mid-write never
+    # leaves a half-written cache behind
+    temp_path = path + ".tmp.npz"
+    np.savez(temp_path, student=store["student"], subject=store["subject"], section=store["section"],
+             score=store["score"], students=np.array(store["students"], dtype=str),
+             subjects=np.array(store["subjects"], dtype=str), sections=np.array(store["sections"], dtype=str),
+             skipped=store.get("skipped", 0), source_stamp=np.array(source_stamp, dtype=np.int64))
+    os.replace(temp_path, path)
+
+
+def load_store(path):
+    with np.load(path) as saved:
+        store = {key: saved[key] for key in ("student", "subject", "section", "score")}
+        for key in ("students", "subjects", "sections"):
+            store[key] = saved[key].tolist()
+        store["skipped"] = int(saved["skipped"]) if "skipped" in saved.files else 0
+        return store, tuple(saved["source_stamp"].tolist())
+
+
+def cached_store(csv_path):
+    # The CSV is parsed once; after that the binary .npz next to it is
+    # loaded instead, until the CSV's size or modification time changes
+    cache = os.path.splitext(csv_path)[0] + "_store.npz"
+    info = os.stat(csv_path)
+    stamp = (info.st_size, info.st_mtime_ns)
+    if os.path.exists(cache):
+        try:
+            store, saved_stamp = load_store(cache)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            saved_stamp = None  # damaged cache: parse the CSV again
+        if saved_stamp == stamp:
+            return store
+    store = read_marks_csv(csv_path)
+    save_store(store, cache, stamp)
+    return store
+
+
+def mean_per_subject(store):
+    totals = np.bincount(store["subject"], weights=store["score"], minlength=len(store["subjects"]))
+    counts = np.bincount(store["subject"], minlength=len(store["subjects"]))
+    return {subject: total / count for subject, total, count in zip(store["subjects"], totals, counts) if count}
+
+
+def student_scores(store, subject=None):
+    # Mean score and section per student, over all subjects or just one;
+    # students without rows for that subject are left out
+    rows = store["subject"] == store["subjects"].index(subject) if subject is not None else slice(None)
+    students = store["student"][rows]
+    counts = np.bincount(students, minlength=len(store["students"]))
+    means = np.bincount(students, weights=store["score"][rows], minlength=len(store["students"]))
+    sections = np.zeros(len(store["students"]), dtype=store["section"].dtype)
+    sections[students] = store["section"][rows]
+    present = np.flatnonzero(counts)
+    return present, sections[present], means[present] / counts[present]
+
+
+def rank_within_class(store, subject=None):
+    # (student codes, section codes, mean scores, ranks) sorted by section
+    # then rank. Ties share a rank, and the next rank skips ahead (1, 2, 2, 4).
+    students, sections, scores = student_scores(store, subject)
+    order = np.lexsort((students, -scores, sections))
+    students, sections, scores = students[order], sections[order], scores[order]
+    positions = np.arange(len(order))
+    new_section = np.r_[True, sections[1:] != sections[:-1]]
+    new_score = new_section | np.r_[True, scores[1:] != scores[:-1]]
+    section_start = np.maximum.accumulate(np.where(new_section, positions, 0))
+    score_start = np.maximum.accumulate(np.where(new_score, positions, 0))
+    return students, sections, scores, score_start - section_start + 1
+
+
+def top_k_per_section(store, k=3, subject=None):
+    # {section: [(student, mean score, rank), ...]} best first
+    students, sections, scores, ranks = rank_within_class(store, subject)
+    keep = np.flatnonzero(ranks <= k)
+    top = {}
+    for i in keep.tolist():
+        top.setdefault(store["sections"][sections[i]], []).append(
+            (store["students"][students[i]], float(scores[i]), int(ranks[i])))
+    return top
+
+
+def print_store_report(store, k=3):
+    if store.get("skipped"):
+        print(f"Rows skipped (no valid score): {store['skipped']:,}")
+    print("\n Mean marks per subject 📚")
+    print("-" * 30)
+    for subject, mean in sorted(mean_per_subject(store).items()):
+        print(f"{subject:<15} {mean:6.2f}")
+    print(f"\n Top {k} per section (mean over all subjects) 🏆")
+    print("-" * 30)
+    for section, toppers in sorted(top_k_per_section(store, k).items()):
+        print(f"{section}: " + ", ".join(f"#{rank} {student} ({score:.1f})" for student, score, rank in toppers))
+
+
+def benchmark_store(rows=10_000_000, subjects=8, sections=40):
+    rng = np.random.default_rng(0)
+    students = rows // subjects
+    store = empty_store()
+    store["students"] = [f"S{i:07d}" for i in range(students)]
+    store["subjects"] = [f"Subject {i}" for i in range(subjects)]
+    store["sections"] = [f"Section {i}" for i in range(sections)]
+    store["student"] = np.repeat(np.arange(students, dtype=np.int32), subjects)
+    store["subject"] = np.tile(np.arange(subjects, dtype=np.int16), students)
+    store["section"] = (store["student"] % sections).astype(np.int16)
+    store["score"] = np.clip(rng.normal(65, 15, len(store["student"])), 0, 100).round(1).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = os.path.join(tmp_dir, "marks_store.npz")
+        start = time.perf_counter()
+        save_store(store, cache)
+        saved = time.perf_counter() - start
+        start = time.perf_counter()
+        store, _ = load_store(cache)
+        loaded = time.perf_counter() - start
+        size = os.path.getsize(cache) / (1024 * 1024)
+
+        csv_rows = min(rows, 1_000_000)
+        marks_csv = os.path.join(tmp_dir, "marks.csv")
+        with open(marks_csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(STORE_COLUMNS)
+            for i in range(csv_rows):
+                writer.writerow([store["students"][store["student"][i]], store["subjects"][store["subject"][i]],
+                                 store["sections"][store["section"][i]], f"{store['score'][i]:.1f}"])
+        start = time.perf_counter()
+        read_marks_csv(marks_csv)
+        parsed = time.perf_counter() - start
+
+    print(f"{len(store['score']):,} score rows, {len(store['students']):,} students")
+    print(f"cache: {size:,.0f} MB, saved in {saved:.2f}s, loaded in {loaded:.2f}s "
+          f"(CSV parse: {csv_rows / parsed:,.0f} rows/s)")
+    for label, report in (
+        ("mean per subject", lambda: mean_per_subject(store)),
+        ("top 3 per section", lambda: top_k_per_section(store, 3)),
+        ("rank within class", lambda: rank_within_class(store)),
+        ("rank in one subject", lambda: rank_within_class(store, "Subject 0")),
+    ):
+        start = time.perf_counter()
+        report()
+        print(f"{label}: {time.perf_counter() - start:.2f}s")
+
+
 def collect_student_data():
     students = {}
 
@@ -39,27 +425,31 @@ def display_report(students):
     if not students:
         print("No student data ❌")
         return
-    
-    marks = list(students.values())
-    max_score = max(marks)
-    min_score = min(marks)
-    average = sum(marks) / len(marks)
-
-    topper = [name for name, score in students.items() if score == max_score ]
-    bottomer = [name for name, score in students.items() if score == min_score ]
 
-    print("\n Students marks report 📝")
-    print("-" * 30)
-    print(f"Total students: {len(students)}")
-    print(f"Average marks for students: {average:.2f}")
-    print(f"Highest marks: {max_score} by {', '.join(topper)}")
-    print(f"Lowest marks: {min_score} by {', '.join(bottomer)}")
+    stats = new_stats()
+    for name, score in students.items():
+        add_score(stats, name, score)
+    print_stats(stats)
 
-    print("-" * 30)
     print("Detailed Marks 📝")
     for name, score in students.items():
         print(f"- {name}: {score}")
 
-students = collect_student_data()
-display_report(students)
 
+if __name__ == "__main__":
+    # python day13.py                  -> type the marks in
+    # python day13.py --csv results.csv -> stream a results file (name, marks columns)
+    # python day13.py --bench [rows]    -> 5M generated rows
+    # python day13.py --store marks.csv [k] -> per-subject means, top k per section
+    # python day13.py --bench-store [rows]  -> 10M-row columnar store timing
+    if len(sys.argv) > 2 and sys.argv[1] == "--csv":
+        print_stats(stream_csv(sys.argv[2]))
+    elif len(sys.argv) > 2 and sys.argv[1] == "--store":
+        print_store_report(cached_store(sys.argv[2]), int(sys.argv[3]) if len(sys.argv) > 3 else 3)
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench-store":
+        benchmark_store(int(sys.argv[2]) if len(sys.argv) > 2 else 10_000_000)
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 5_000_000)
+    else:
+        students = collect_student_data()
+        display_report(students)
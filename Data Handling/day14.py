@@ -22,15 +22,119 @@ Bonus:
 """
 
 import os
+import re
+import sys
 import json
+import time
+import heapq
+import random
+import bisect
+import itertools
+import unicodedata
 
 FILENAME = "movies.json"
 
+
+def word_pattern():
+    # \w plus combining marks (Devanagari vowel signs, viramas, ...), which
+    # \w alone leaves out and so would split "ड्रामा" into single letters
+    # (Brahmi, Chakma and other scripts past U+FFFF too). Marks only exist in
+    # planes 0-1 and the variation selectors of plane 14; planes 2-3 are CJK
+    # ideographs and the rest is unassigned, so scanning those would only
+    # slow down the import.
+    def escape(code):
+        return f"\\u{code:04x}" if code <= 0xFFFF else f"\\U{code:08x}"
+
+    marks, start, previous = [], None, None
+    for code in itertools.chain(range(0x300, 0x20000), range(0xE0000, 0xE1000)):
+        if not unicodedata.category(chr(code)).startswith("M"):
+            continue
+        if code - 1 != previous:
+            if start is not None:
+                marks.append(f"{escape(start)}-{escape(previous)}")
+            start = code
+        previous = code
+    marks.append(f"{escape(start)}-{escape(previous)}")
+    return re.compile(f"[\\w{''.join(marks)}]+")
+
+
+WORD = word_pattern()  # used on lowercased text, any script
+
+# Built by load_movies() and kept current by add_movies():
+# words: title/genre word -> {position in movies: None} (a dict used as an
+# ordered set), vocab: the same words sorted for prefix lookups, titles:
+# title -> position for duplicate checks
+movie_index = {"words": {}, "vocab": [], "titles": {}}
+
+
+def movie_words(movie):
+    return set(WORD.findall(f"{movie['title']} {movie['genre']}".lower()))
+
+
+def index_movie(index, movies, position):
+    movie = movies[position]
+    index["titles"][movie["title"].lower()] = position
+    for word in movie_words(movie):
+        postings = index["words"].get(word)
+        if postings is None:
+            postings = index["words"][word] = {}
+            bisect.insort(index["vocab"], word)
+        postings[position] = None
+
+
+def build_movie_index(movies):
+    index = {"words": {}, "vocab": [], "titles": {}}
+    for position, movie in enumerate(movies):
+        index["titles"][movie["title"].lower()] = position
+        for word in movie_words(movie):
+            index["words"].setdefault(word, {})[position] = None
+    index["vocab"] = sorted(index["words"])
+    return index
+
+
+def prefix_words(index, prefix):
+    start = bisect.bisect_left(index["vocab"], prefix)
+    end = bisect.bisect_left(index["vocab"], prefix + "\U0010ffff")  # sorts after any continuation
+    return index["vocab"][start:end]
+
+
+def find_movies(movies, query, index=None, limit=None):
+    # Every query word must match the start of some title or genre word
+    # ("star wa" finds "Star Wars"). Candidates come from the query word with
+    # the fewest postings; the other words are checked on those movies only.
+    # Best rated first.
+    index = index or movie_index
+    terms = WORD.findall(query.lower())
+    if not terms:
+        return []
+    expansions = []
+    for term in terms:
+        words = prefix_words(index, term)
+        expansions.append((sum(len(index["words"][word]) for word in words), term, words))
+    expansions.sort(key=lambda expansion: expansion[0])
+    _, first, words = expansions[0]
+    candidates = {position for word in words for position in index["words"][word]}
+    others = [term for _, term, _ in expansions[1:]]
+    if others:
+        candidates = [
+            position for position in candidates
+            if all(any(word.startswith(term) for word in movie_words(movies[position])) for term in others)
+        ]
+    results = (movies[position] for position in candidates)
+    if limit is None:
+        return sorted(results, key=lambda movie: movie["rating"], reverse=True)
+    return heapq.nlargest(limit, results, key=lambda movie: movie["rating"])
+
+
 def load_movies():
+    global movie_index
     if not os.path.exists(FILENAME):
-        return []
-    with open (FILENAME, "r", encoding="utf-8")as f:
-        return json.load(f)
+        movies = []
+    else:
+        with open (FILENAME, "r", encoding="utf-8")as f:
+            movies = json.load(f)
+    movie_index = build_movie_index(movies)
+    return movies
     
 def save_movies(movies):
     with open(FILENAME, "w", encoding="utf-8")as f:
@@ -38,7 +142,7 @@ def save_movies(movies):
 
 def add_movies(movies):
     title = input ("Enter the movie name: ").strip().lower()
-    if any(movie for movie in movies):
+    if title in movie_index["titles"]:
         print("Movie already exists")
         return
     genre = input("Genre: ").strip().lower()
@@ -51,23 +155,21 @@ def add_movies(movies):
         return 
 
     movies.append({"title": title, "genre": genre, "rating": rating})
+    index_movie(movie_index, movies, len(movies) - 1)
     save_movies(movies)
     print("Movie added ✅")
 
 def search_movies(movies):
     term = input("Enter the title or genre: ").strip().lower()
 
-    results = [
-        movie for movie in movies
-        if term in movie['title'].lower() or term in movie ['genre'].lower()
-    ]
+    results = find_movies(movies, term)
     if not results:
         print("No matching result")
         return 
     print(f"Found {len(results)} result(s)")
 
     for movie in results:
-        print(f"{movie["title"]} -- {movie["genre"]} -- {movie["rating"]}")
+        print(f"{movie['title']} -- {movie['genre']} -- {movie['rating']}")
 
 def view_movie(movies):
     if not movies:
@@ -75,9 +177,44 @@ def view_movie(movies):
         return 
     print("-" * 30)
     for movie in movies:
-        print(f"{movie["title"]} -- {movie["genre"]} -- {movie["rating"]}")
+        print(f"{movie['title']} -- {movie['genre']} -- {movie['rating']}")
     print("-" * 30)
 
+def benchmark(count=1_000_000, queries=200):
+    rng = random.Random(0)
+    words = ["star", "wars", "night", "dark", "knight", "return", "king", "lost", "city", "love", "story",
+             "last", "ship", "ocean", "fire", "ice", "dream", "river", "ghost", "empire", "road", "silent"]
+    genres = ["action", "drama", "comedy", "horror", "romance", "sci-fi", "thriller", "animation"]
+    movies = [{"title": f"{' '.join(rng.sample(words, rng.randint(1, 3)))} {i}", "genre": rng.choice(genres),
+               "rating": round(rng.uniform(1, 10), 1)} for i in range(count)]
+
+    start = time.perf_counter()
+    index = build_movie_index(movies)
+    print(f"{count:,} movies indexed in {time.perf_counter() - start:.1f}s")
+
+    picks = [movies[rng.randrange(count)] for _ in range(queries)]
+    for label, query_of in (
+        ("exact title", lambda movie: movie["title"]),
+        ("title word + genre", lambda movie: f"{movie['title'].split()[0]} {movie['genre']} {movie['title'].split()[-1]}"),
+        ("prefixes", lambda movie: f"{movie['title'].split()[0][:3]} {movie['genre'][:2]} {movie['title'].split()[-1][:4]}"),
+    ):
+        start = time.perf_counter()
+        found = sum(movie in find_movies(movies, query_of(movie), index, limit=10) for movie in picks)
+        elapsed = (time.perf_counter() - start) / queries * 1000
+        print(f"{label:>18}: {elapsed:.2f} ms per query, {found}/{queries} found")
+
+    start = time.perf_counter()
+    for movie in picks[:10]:
+        term = movie["title"].split()[-1]
+        [m for m in movies if term in m["title"].lower() or term in m["genre"].lower()]
+    print(f"{'full scan':>18}: {(time.perf_counter() - start) / 10 * 1000:.2f} ms per query")
+
+    start = time.perf_counter()
+    for i in range(10_000):
+        movies.append({"title": f"new movie {i}", "genre": "drama", "rating": 5.0})
+        index_movie(index, movies, len(movies) - 1)
+    print(f"10,000 adds kept indexed in {time.perf_counter() - start:.2f}s")
+
 def run_movie_db():
     movies = load_movies()
     while True:
@@ -100,4 +237,8 @@ def run_movie_db():
             case _: print("Enter valid choice!!")
 
 if __name__=="__main__":
-    run_movie_db()
\ No newline at end of file
+    # python day14.py --bench [movies] -> 1M-title catalog search timing
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+    else:
+        run_movie_db()
\ No newline at end of file
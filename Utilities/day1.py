@@ -26,22 +26,32 @@ Bonus:
 """
 
 import datetime
-name = input("What is your name? ").strip()
-age = input("How old are you? ").strip()
-city = input("Which city do you live in? ").strip()
-profession = input("What is your profession? ").strip()
-hobby = input("What is your hobby? ").strip()
 
-intro_message = (
-    f"\nHello! My name is {name}. I'm {age} years old and live in {city}."
-    f"\nI work as a {profession} and I absolutely enjoy {hobby} in my free time."
-    f"\nNice to meet you!\n"
-)
+BORDER = "*" * 80
 
-current_date = datetime.date.today().isoformat()
-intro_message += f"\nLogged on {current_date}\n"
 
-border = "*" * 80
-final_output = f"{border}\n{intro_message}\n{border}"
+def render_intro(name, age, city, profession, hobby, logged_on):
+    intro_message = (
+        f"\nHello! My name is {name}. I'm {age} years old and live in {city}."
+        f"\nI work as a {profession} and I absolutely enjoy {hobby} in my free time."
+        f"\nNice to meet you!\n"
+        f"\nLogged on {logged_on}\n"
+    )
+    return f"{BORDER}\n{intro_message}\n{BORDER}"
 
-print("\n" + final_output)
\ No newline at end of file
+
+def main():
+    name = input("What is your name? ").strip()
+    age = input("How old are you? ").strip()
+    city = input("Which city do you live in? ").strip()
+    profession = input("What is your profession? ").strip()
+    hobby = input("What is your hobby? ").strip()
+
+    current_date = datetime.date.today().isoformat()
+    final_output = render_intro(name, age, city, profession, hobby, current_date)
+
+    print("\n" + final_output)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,7 +24,162 @@ Bonus:
 - Show a clean interface
 """
 
+import os
+import string
+import sys
+import time
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+SHIFT_TABLES = {}  # key (0-25) -> str.maketrans table, built on first use
+BYTE_TABLES = {}  # same, as 256-byte tables for bytes.translate in file mode
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Relative frequency of a-z in English text
+ENGLISH_FREQ = np.array([
+    8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966, 0.153, 0.772, 4.025, 2.406,
+    6.749, 7.507, 1.929, 0.095, 5.987, 6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074,
+]) / 100
+
+# SHIFTED[k, i] is the ciphertext letter that plaintext letter i becomes under key k
+SHIFTED = (np.arange(26)[None, :] + np.arange(26)[:, None]) % 26
+
+# Byte value -> letter number 0-25 (upper and lower case folded), 26 for everything else
+LETTER_OF_BYTE = np.full(256, 26, dtype=np.intp)
+LETTER_OF_BYTE[np.frombuffer(string.ascii_lowercase.encode(), np.uint8)] = np.arange(26)
+LETTER_OF_BYTE[np.frombuffer(string.ascii_uppercase.encode(), np.uint8)] = np.arange(26)
+
+
+def shift_table(key):
+    key %= 26
+    if key not in SHIFT_TABLES:
+        lower, upper = string.ascii_lowercase, string.ascii_uppercase
+        SHIFT_TABLES[key] = str.maketrans(
+            lower + upper,
+            lower[key:] + lower[:key] + upper[key:] + upper[:key],
+        )
+    return SHIFT_TABLES[key]
+
+
 def encrypt(message, key):
+    return message.translate(shift_table(key))
+
+
+def decrypt(message, key):
+    return encrypt(message, -key)
+
+
+def byte_shift_table(key):
+    # ASCII letters are single bytes in UTF-8 and every other byte maps to itself,
+    # so files can be shifted without decoding them
+    key %= 26
+    if key not in BYTE_TABLES:
+        lower, upper = string.ascii_lowercase.encode(), string.ascii_uppercase.encode()
+        BYTE_TABLES[key] = bytes.maketrans(
+            lower + upper,
+            lower[key:] + lower[:key] + upper[key:] + upper[:key],
+        )
+    return BYTE_TABLES[key]
+
+
+def encrypt_chunk(chunk, key):
+    return chunk.translate(byte_shift_table(key))
+
+
+def encrypt_range(src, dst, key, offset, length):
+    # Output has the same length as input, so each worker writes its own slice
+    # of dst in place and no chunk data has to travel between processes
+    with open(src, "rb") as fin, open(dst, "r+b") as fout:
+        fin.seek(offset)
+        fout.seek(offset)
+        fout.write(encrypt_chunk(fin.read(length), key))
+
+
+def encrypt_file(src, dst, key, workers=None, chunk_size=CHUNK_SIZE):
+    # Read in fixed-size chunks: one chunk in memory per worker at most
+    # Workers write into a temp file next to dst that replaces it at the end,
+    # so dst may be src itself and a failed run leaves the old dst untouched
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(src)
+    fd, tmp_dst = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dst)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fout:
+            fout.truncate(size)
+        os.chmod(tmp_dst, os.stat(src).st_mode & 0o777)  # mkstemp makes it owner-only
+
+        offsets = range(0, size, chunk_size)
+        if workers == 1 or len(offsets) == 1:
+            for offset in offsets:
+                encrypt_range(src, tmp_dst, key, offset, chunk_size)
+        else:
+            with ProcessPoolExecutor(workers) as pool:
+                n = len(offsets)
+                list(pool.map(encrypt_range, [src] * n, [tmp_dst] * n, [key] * n, offsets, [chunk_size] * n))
+        os.replace(tmp_dst, dst)
+    except BaseException:
+        os.remove(tmp_dst)
+        raise
+
+
+def decrypt_file(src, dst, key, workers=None, chunk_size=CHUNK_SIZE):
+    encrypt_file(src, dst, -key, workers, chunk_size)
+
+
+def letter_counts(data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    byte_counts = np.bincount(np.frombuffer(data, np.uint8), minlength=256)
+    return np.bincount(LETTER_OF_BYTE, weights=byte_counts, minlength=27)[:26]
+
+
+def file_letter_counts(path, chunk_size=CHUNK_SIZE):
+    # One streaming pass; only the 26 running totals are kept
+    counts = np.zeros(26)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            counts += letter_counts(chunk)
+    return counts
+
+
+def chi_squared(counts):
+    # counts: (..., 26) letter histograms -> (..., 26) score per key, lower is more English
+    counts = np.asarray(counts, dtype=float)
+    expected = counts.sum(axis=-1, keepdims=True)[..., None] * ENGLISH_FREQ
+    expected = np.maximum(expected, 1e-9)
+    observed = counts[..., SHIFTED]
+    return ((observed - expected) ** 2 / expected).sum(axis=-1)
+
+
+def rank_keys(counts):
+    scores = chi_squared(counts)
+    order = np.argsort(scores)
+    return [(int(key), float(scores[key])) for key in order]
+
+
+def crack(ciphertext):
+    # [(key, chi-squared), ...] best first; decrypt(ciphertext, key) recovers the text
+    return rank_keys(letter_counts(ciphertext))
+
+
+def crack_file(path):
+    return rank_keys(file_letter_counts(path))
+
+
+def crack_batch(ciphertexts):
+    # One vectorized pass for many short messages: returns a (messages, 26) array
+    # of keys, best first on each row
+    data = [text.encode("utf-8") if isinstance(text, str) else text for text in ciphertexts]
+    lengths = np.fromiter((len(d) for d in data), dtype=np.intp, count=len(data))
+    letters = LETTER_OF_BYTE[np.frombuffer(b"".join(data), np.uint8)]
+    message = np.repeat(np.arange(len(data)), lengths)
+    counts = np.bincount(message * 27 + letters, minlength=len(data) * 27)
+    counts = counts.reshape(len(data), 27)[:, :26]
+    return np.argsort(chi_squared(counts), axis=1)
+
+
+def encrypt_by_char(message, key):
+    # The original one-character-at-a-time loop, kept for the benchmark
     result = ""
     for char in message:
         if char.isalpha():
@@ -35,28 +190,82 @@ def encrypt(message, key):
             result += char
     return result
 
-def decrypt(message, key):
-    return encrypt(message, -key)
 
-print("Secret message program")
-choice = input("Do you want to E or D?").strip().lower()
+def benchmark(size_mb=4, file_mb=256):
+    sample = "The quick brown fox jumps over the lazy dog, 42 times! "
+    text = (sample * (size_mb * 1024 * 1024 // len(sample) + 1))[:size_mb * 1024 * 1024]
+    for name, func in (("translate table", encrypt), ("per-char loop", encrypt_by_char)):
+        start = time.perf_counter()
+        result = func(text, 3)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>15}: {size_mb / elapsed:8.1f} MB/s")
+    assert result == encrypt(text, 3)
 
-if choice == "e":
-    text = input("Enter your message: \n")
-    try:
-        key = int(input("Enter a number between 1 and 25: "))
-        encrypted = encrypt(text, key)
-        print(encrypted)
-    except ValueError:
-        print("Invalid key")
-elif choice == 'd':
-    text = input("Enter your encrypted message: \n")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        src, dst = os.path.join(tmp_dir, "plain.txt"), os.path.join(tmp_dir, "secret.txt")
+        with open(src, "w", encoding="utf-8") as f:
+            for _ in range(file_mb // size_mb):
+                f.write(text)
+        for workers in sorted({1, 2, os.cpu_count() or 1}):
+            start = time.perf_counter()
+            encrypt_file(src, dst, 3, workers)
+            elapsed = time.perf_counter() - start
+            print(f"file, {workers:>2} worker(s): {file_mb / elapsed:8.1f} MB/s")
+
+
+def file_mode():
+    src = input("File to read: ").strip()
+    dst = input("File to write: ").strip()
+    if not os.path.isfile(src):
+        print("File not found")
+        return
+    direction = input("Do you want to E or D the file? ").strip().lower()
+    if direction not in ("e", "d"):
+        print("Invalid Choice")
+        return
     try:
         key = int(input("Enter a number between 1 and 25: "))
-        decrypted = decrypt(text,key)
-        print("Decrypted message: ")
-        print(decrypted)
     except ValueError:
         print("Invalid key")
-else:
-    print("Invalid Choice")
+        return
+    (encrypt_file if direction == "e" else decrypt_file)(src, dst, key)
+    print(f"Saved to {dst}")
+
+
+def main():
+    print("Secret message program")
+    choice = input("Do you want to E, D, F (whole file) or C (crack without key)?").strip().lower()
+
+    if choice == "f":
+        file_mode()
+    elif choice == "c":
+        text = input("Enter your encrypted message: \n")
+        print("Most likely keys:")
+        for key, score in crack(text)[:3]:
+            print(f"{key:>2} (score {score:.1f}): {decrypt(text, key)}")
+    elif choice == "e":
+        text = input("Enter your message: \n")
+        try:
+            key = int(input("Enter a number between 1 and 25: "))
+            encrypted = encrypt(text, key)
+            print(encrypted)
+        except ValueError:
+            print("Invalid key")
+    elif choice == 'd':
+        text = input("Enter your encrypted message: \n")
+        try:
+            key = int(input("Enter a number between 1 and 25: "))
+            decrypted = decrypt(text,key)
+            print("Decrypted message: ")
+            print(decrypted)
+        except ValueError:
+            print("Invalid key")
+    else:
+        print("Invalid Choice")
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -16,6 +16,13 @@ Bonus:
 - Capitalize and center the final output in a framed box
 """
 
+import sys
+import numpy as np
+
+VOWEL_BITS = sum(1 << (ord(v) - ord("a")) for v in "aeiou")
+POPCOUNT_8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
 def friendship_score(name1, name2):
     name1 = name1.lower().strip()
     name2 = name2.lower().strip()
@@ -75,4 +82,103 @@ def run_friendship_calculator():
     print_box(message.upper())
 
 
-run_friendship_calculator()
+def popcount(values):
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    return POPCOUNT_8[values[..., None].view(np.uint8)].sum(axis=-1)
+
+
+def name_profiles(names):
+    # a-z keep bits 0-25 so vowels are a fixed mask; any other character
+    # (digits, hyphens, accents, other scripts) gets the next free bit. Masks
+    # are rows of words: one uint32 while 32 bits do, else as many uint64s
+    # as the roster needs.
+    bits = {chr(ord("a") + i): i for i in range(26)}
+    cleaned = [name.lower().strip() for name in names]
+    masks = []
+    width = max((len(name) for name in cleaned), default=0)
+    codes = np.zeros((len(cleaned), width), dtype=np.uint32)  # 0 = space or padding
+    for row, name in enumerate(cleaned):
+        mask = 0
+        for char in set(name) - {" "}:
+            if char not in bits:
+                bits[char] = len(bits)
+            mask |= 1 << bits[char]
+        masks.append(mask)
+        codes[row, :len(name)] = [0 if c == " " else ord(c) for c in name]
+
+    if len(bits) <= 32:
+        masks = np.array(masks, dtype=np.uint32)[:, None]
+    else:
+        words = (len(bits) + 63) // 64
+        masks = np.array([[mask >> (64 * word) & (2 ** 64 - 1) for word in range(words)] for mask in masks],
+                         dtype=np.uint64).reshape(len(masks), words)
+
+    # For every position, the rows holding each character there
+    groups = []
+    for column in codes.T:
+        order = np.argsort(column, kind="stable")
+        chars, firsts = np.unique(column[order], return_index=True)
+        ends = np.append(firsts[1:], len(order))
+        groups.append({char: order[first:end] for char, first, end in zip(chars, firsts, ends) if char})
+    return masks, codes, groups
+
+
+def score_block(profiles, start, stop):
+    # Scores of names[start:stop] against every name: a (stop - start, N) array
+    masks, codes, groups = profiles
+    score = np.zeros((stop - start, len(masks)), dtype=np.int16)
+    for word in range(masks.shape[1]):
+        shared = masks[start:stop, word, None] & masks[None, :, word]
+        score += popcount(shared).astype(np.int16) * 5
+        if word == 0:  # the vowels all live in the first word
+            score += popcount(shared & masks.dtype.type(VOWEL_BITS)).astype(np.int16) * 10
+
+    # Same character at the same position: only pairs inside one group match,
+    # so each position costs (block rows x group size), not block x N x width
+    for column, by_char in zip(codes[start:stop].T, groups):
+        for char in np.unique(column):
+            if char:
+                mine = np.flatnonzero(column == char)
+                score[np.ix_(mine, by_char[char])] += 7
+    return np.minimum(score, 100)
+
+
+def top_matches(names, k=5, block_size=256):
+    # Yields (name, [(friend, score), ...]) for every name, best first, working
+    # through the N x N score matrix one block of rows at a time
+    profiles = name_profiles(names)
+    k = min(k, len(names) - 1)
+    for start in range(0, len(names), block_size):
+        stop = min(start + block_size, len(names))
+        scores = score_block(profiles, start, stop)
+        scores[np.arange(stop - start), np.arange(start, stop)] = -1  # not your own friend
+        if k == 0:
+            for row in range(stop - start):
+                yield names[start + row], []
+            continue
+
+        # Scores only run 0-100, so pick each row's k-th best value with a
+        # partition and keep everything above it plus the earliest ties
+        threshold = np.partition(scores, scores.shape[1] - k, axis=1)[:, -k]
+        for row, cutoff in enumerate(threshold):
+            above = np.flatnonzero(scores[row] > cutoff)
+            tied = np.flatnonzero(scores[row] == cutoff)[:k - len(above)]
+            picks = np.concatenate((above, tied))
+            picks = picks[np.lexsort((picks, -scores[row, picks]))]
+            yield names[start + row], [(names[j], int(scores[row, j])) for j in picks]
+
+
+def roster_main(path, k=5):
+    # python day11.py roster.txt [k] -- one name per line
+    with open(path, "r", encoding="utf-8") as f:
+        names = [line.strip() for line in f if line.strip()]
+    for name, matches in top_matches(names, k):
+        print(f"{name}: " + ", ".join(f"{friend} ({score}%)" for friend, score in matches))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        roster_main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 5)
+    else:
+        run_friendship_calculator()
@@ -31,39 +31,220 @@ Bonus:
 - Ask the user if they want to save the result into a '.txt' file.
 """
 
+import os
+import re
+import sys
+import csv
+import time
+import datetime
+import tempfile
 import textwrap
-name = input("What is your name? ").strip()
-profession = input("What do you do? ").strip()
-passion = input("Name your passion: ").strip()
-emoji = input("An emoji which is associated with you: ").strip()
-website = input("Enter your website: ").strip()
-
-print("\nChoose your style: ")
-print("1.Simple Lines")
-print("2.Vertical Lines")
-print("3.Emoji Sandwich")
-
-style = input("Enter option 1, 2 or 3: ").strip()
-
-def generate_bio(style):
-    if style == "1":
-        return f"{emoji} {name} | {profession} \n 💡 {passion} \n {website}" if website else {website}
-    elif style == "2":
-        return f"{emoji} {name}\n {profession}🔥\n {passion} \n {website}🔥"
-    elif style == "3":
-        return f"{emoji*3}\n {name} - {profession}\n {passion} \n {website}\n {emoji*3}"
-    
-bio = generate_bio(style)
-
-print("\nYour stylish bio:\n")
-print("*" * 50)
-print(textwrap.dedent(bio))
-print("*" * 50)
-
-save = input("Do you want to save this bio to a text file? (y/n): ").lower()
-
-if save == 'y':
-    filename =f"{name.lower().replace(' ','_')}_bio.txt"
-    with open (filename, "w", encoding="utf-8") as f:
-        f.write(bio)
-    print("File saved")
+from collections import deque
+from multiprocessing import Pool
+
+from day1 import render_intro
+
+ROSTER_CHUNK = 5_000  # people rendered per worker task
+SHARD_SIZE = 1_000  # per-user files per sub-folder when sharding
+ROSTER_COLUMNS = ("name", "age", "city", "profession", "hobby", "passion", "emoji", "website")
+
+
+# Each layout is a plain function, so its f-string is compiled once at import
+# and rendering a bio is a single call, never a re-parse of the template
+def simple_lines(name, profession, passion, emoji, website):
+    if website:
+        return f"{emoji} {name} | {profession} \n 💡 {passion} \n {website}"
+    return f"{emoji} {name} | {profession} \n 💡 {passion}"
+
+
+def vertical_lines(name, profession, passion, emoji, website):
+    return f"{emoji} {name}\n {profession}🔥\n {passion} \n {website}🔥"
+
+
+def emoji_sandwich(name, profession, passion, emoji, website):
+    return f"{emoji*3}\n {name} - {profession}\n {passion} \n {website}\n {emoji*3}"
+
+
+LAYOUTS = {"1": simple_lines, "2": vertical_lines, "3": emoji_sandwich}
+
+
+def generate_bio(style, name, profession, passion, emoji, website):
+    return LAYOUTS[style](name, profession, passion, emoji, website)
+
+
+def bio_filename(name):
+    # Anything but letters, digits, "." and "-" becomes "_", so names like
+    # "AC/DC Fan" or ones with characters Windows refuses stay one safe file
+    safe = re.sub(r"[^\w.-]+", "_", name.lower()).strip("._")[:80]
+    return f"{safe or 'bio'}_bio.txt"
+
+
+def read_roster(path):
+    # Streams (name, age, city, profession, hobby, passion, emoji, website)
+    # tuples; missing columns are left empty
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [column.strip().lower() for column in next(reader)]
+        positions = [header.index(column) if column in header else None for column in ROSTER_COLUMNS]
+        for row in reader:
+            yield tuple(row[at].strip() if at is not None and at < len(row) else "" for at in positions)
+
+
+def render_person(person, layouts, logged_on):
+    name, age, city, profession, hobby, passion, emoji, website = person
+    parts = [render_intro(name, age, city, profession, hobby, logged_on)]
+    for layout in layouts:
+        parts.append(textwrap.dedent(layout(name, profession, passion, emoji, website)))
+    return "\n\n".join(parts) + "\n\n"
+
+
+def render_chunk(start, people, styles, logged_on, shard_dir=None):
+    # Returns the rendered text, or writes one file per person under
+    # shard_dir/<start // SHARD_SIZE>/ and returns how many were written
+    layouts = [LAYOUTS[style] for style in styles]
+    if shard_dir is None:
+        return "".join(render_person(person, layouts, logged_on) for person in people)
+
+    folder = None
+    for number, person in enumerate(people, start):
+        if folder is None or number % SHARD_SIZE == 0:
+            folder = os.path.join(shard_dir, f"{number // SHARD_SIZE:05d}")
+            os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"{number:07d}_{bio_filename(person[0])}")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(render_person(person, layouts, logged_on))
+    return len(people)
+
+
+def roster_chunks(path, size):
+    chunk, start = [], 0
+    for person in read_roster(path):
+        chunk.append(person)
+        if len(chunk) == size:
+            yield start, chunk
+            start += size
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def render_roster(src, dst=None, shard_dir=None, styles="123", workers=None, chunk_size=ROSTER_CHUNK):
+    # Renders the intro and the chosen bio layouts for everybody in the
+    # roster, either into one combined file (dst) or one file per person
+    # (shard_dir). Chunks stay in roster order; at most two per worker are
+    # in flight, so memory stays flat for any roster size.
+    workers = workers or os.cpu_count() or 1
+    logged_on = datetime.date.today().isoformat()
+    people = 0
+    out = open(dst, "w", encoding="utf-8", buffering=1024 * 1024) if dst else None
+    pool = Pool(workers) if workers > 1 else None
+
+    def collect(result):
+        nonlocal people
+        if out:
+            out.write(result)
+        else:
+            people += result
+
+    try:
+        pending = deque()
+        for start, chunk in roster_chunks(src, chunk_size):
+            if out:
+                people += len(chunk)
+            args = (start, chunk, styles, logged_on, shard_dir)
+            if pool is None:
+                collect(render_chunk(*args))
+                continue
+            pending.append(pool.apply_async(render_chunk, args))
+            if len(pending) >= workers * 2:
+                collect(pending.popleft().get())
+        while pending:
+            collect(pending.popleft().get())
+    finally:
+        if pool:
+            pool.terminate()
+        if out:
+            out.close()
+    return people
+
+
+def benchmark(count=500_000):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        roster = os.path.join(tmp_dir, "roster.csv")
+        with open(roster, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(ROSTER_COLUMNS)
+            for i in range(count):
+                writer.writerow((f"Person {i}", 20 + i % 50, "Jaipur", "Software Developer",
+                                 "playing guitar", "Making things beautiful", "🎨",
+                                 f"@person{i}" if i % 4 else ""))
+
+        for workers in sorted({1, os.cpu_count() or 1}):
+            start = time.perf_counter()
+            people = render_roster(roster, os.path.join(tmp_dir, "bios.txt"), workers=workers)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(os.path.join(tmp_dir, "bios.txt")) / (1024 * 1024)
+            print(f"combined, {workers} worker(s): {people:,} people, {size:,.0f} MB "
+                  f"in {elapsed:.1f}s ({people / elapsed:,.0f} people/s)")
+
+        sharded = min(count, 20_000)
+        small = os.path.join(tmp_dir, "small.csv")
+        with open(roster, "r", encoding="utf-8") as fin, open(small, "w", encoding="utf-8") as fout:
+            for _ in range(sharded + 1):
+                fout.write(fin.readline())
+        start = time.perf_counter()
+        people = render_roster(small, shard_dir=os.path.join(tmp_dir, "bios"))
+        elapsed = time.perf_counter() - start
+        print(f"sharded: {people:,} per-user files in {elapsed:.1f}s ({people / elapsed:,.0f} files/s)")
+
+
+def main():
+    name = input("What is your name? ").strip()
+    profession = input("What do you do? ").strip()
+    passion = input("Name your passion: ").strip()
+    emoji = input("An emoji which is associated with you: ").strip()
+    website = input("Enter your website: ").strip()
+
+    print("\nChoose your style: ")
+    print("1.Simple Lines")
+    print("2.Vertical Lines")
+    print("3.Emoji Sandwich")
+
+    style = input("Enter option 1, 2 or 3: ").strip()
+    while style not in LAYOUTS:
+        style = input("Please enter 1, 2 or 3: ").strip()
+
+    bio = generate_bio(style, name, profession, passion, emoji, website)
+
+    print("\nYour stylish bio:\n")
+    print("*" * 50)
+    print(textwrap.dedent(bio))
+    print("*" * 50)
+
+    save = input("Do you want to save this bio to a text file? (y/n): ").lower()
+
+    if save == 'y':
+        filename = bio_filename(name)
+        with open (filename, "w", encoding="utf-8") as f:
+            f.write(bio)
+        print("File saved")
+
+
+if __name__ == "__main__":
+    # python day2.py                                            -> interactive
+    # python day2.py --roster roster.csv out.txt [styles] [workers] -> one combined file
+    # python day2.py --roster roster.csv --shard out_dir [styles]    -> one file per person
+    # python day2.py --bench [people]                           -> 500k-person roster timing
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 500_000)
+    elif len(sys.argv) > 4 and sys.argv[1] == "--roster" and sys.argv[3] == "--shard":
+        styles = sys.argv[5] if len(sys.argv) > 5 else "123"
+        people = render_roster(sys.argv[2], shard_dir=sys.argv[4], styles=styles)
+        print(f"Wrote {people:,} bio files under {sys.argv[4]}")
+    elif len(sys.argv) > 3 and sys.argv[1] == "--roster":
+        styles = sys.argv[4] if len(sys.argv) > 4 else "123"
+        workers = int(sys.argv[5]) if len(sys.argv) > 5 else None
+        people = render_roster(sys.argv[2], sys.argv[3], styles=styles, workers=workers)
+        print(f"Rendered {people:,} people into {sys.argv[3]}")
+    else:
+        main()
@@ -26,28 +26,295 @@ Bonus:
 -Print a decorative summary box
 """
 
-def get_float(prompt):
+import sys
+import csv
+import heapq
+import random
+import time
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+EXACT_LIMIT = 18  # largest group plan_exact() will search (2 ** n subsets)
+
+
+def to_paise(amount):
+    # "1200", "1200.5", "-30.25" -> integer paise, without going through float
+    text = str(amount).strip()
+    sign = -1 if text.startswith("-") else 1
+    text = text[1:] if sign < 0 else text  # at most one minus sign
+    if len(text) > 3 and text[-3] == "." and text[:-3].isdecimal() and text[-2:].isdecimal():
+        return sign * int(text[:-3] + text[-2:])  # the common "1234.50" case
+    text = text.replace(",", "").lstrip("₹")
+    whole, _, fraction = text.partition(".")
+    if len(fraction) <= 2 and whole.isdecimal() and (not fraction or fraction.isdecimal()):
+        return sign * (int(whole) * 100 + int(fraction.ljust(2, "0") or 0))
+    if sign < 0 and text[:1] in ("+", "-"):  # "--5" or "-+5"
+        raise InvalidOperation(f"Not an amount: {amount}")
+    value = sign * Decimal(text)
+    if not value.is_finite():
+        raise InvalidOperation(f"Not an amount: {text}")
+    return int((value * 100).to_integral_value(ROUND_HALF_UP))
+
+
+def format_paise(paise):
+    sign = "-" if paise < 0 else ""
+    rupees, rest = divmod(abs(paise), 100)
+    return f"{sign}{rupees:,}.{rest:02d}"
+
+
+def split_amount(total, weights):
+    # Largest remainder: everybody gets the floor of their exact share, then
+    # the leftover paise go to the largest fractional parts (earlier people
+    # first on ties). The shares always add up to the total exactly.
+    weight_sum = sum(weights)
+    if weight_sum <= 0:
+        raise ValueError("Weights must add up to more than zero")
+    sign = -1 if total < 0 else 1
+    total = abs(total)
+    shares = [total * w // weight_sum for w in weights]
+    leftover = total - sum(shares)
+    if leftover:
+        by_remainder = sorted((-(total * w % weight_sum), i) for i, w in enumerate(weights))
+        for _, i in by_remainder[:leftover]:
+            shares[i] += 1
+    return [sign * share for share in shares]
+
+
+def parse_participants(text):
+    # "Aman;Neha:2;Ravi" -> (["Aman", "Neha", "Ravi"], [1, 2, 1])
+    names, weights = [], []
+    for part in text.split(";"):
+        name, _, weight = part.partition(":")
+        if name.strip():
+            names.append(name.strip())
+            weights.append(int(weight) if weight.strip() else 1)
+    return names, weights
+
+
+def add_expense(balances, payer, amount, names, weights=None):
+    # balances: name -> [paid, owed] in paise; one call per bill or bill item
+    shares = split_amount(amount, weights or [1] * len(names))
+    balances.setdefault(payer, [0, 0])[0] += amount
+    for name, share in zip(names, shares):
+        balances.setdefault(name, [0, 0])[1] += share
+    return shares
+
+
+def settle_csv(path):
+    # Streams an expenses CSV with columns payer, amount, split_between
+    # (itemised bills are simply one row per item). Returns name -> [paid, owed].
+    balances = {}
+    groups = {}  # split_between text -> (owed counters, weights, equal split?)
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [name.strip().lower() for name in next(reader)]
+        payer_at, amount_at, split_at = (header.index(c) for c in ("payer", "amount", "split_between"))
+
+        for row in reader:
+            amount = to_paise(row[amount_at])
+            payer = balances.get(row[payer_at].strip())
+            if payer is None:
+                payer = balances[row[payer_at].strip()] = [0, 0]
+            payer[0] += amount
+
+            group = groups.get(row[split_at])
+            if group is None:
+                names, weights = parse_participants(row[split_at])
+                owed = [balances.setdefault(name, [0, 0]) for name in names]
+                group = groups[row[split_at]] = (owed, weights, set(weights) == {1})
+            owed, weights, equal = group
+            if equal and amount >= 0:
+                # Equal split: the leftover paise go to the first people
+                share, leftover = divmod(amount, len(weights))
+                for i, person in enumerate(owed):
+                    person[1] += share + (i < leftover)
+            else:
+                for person, share in zip(owed, split_amount(amount, weights)):
+                    person[1] += share
+    return balances
+
+
+def net_balances(balances):
+    # name -> paid - owed, leaving out anyone who is already square
+    return {name: paid - owed for name, (paid, owed) in balances.items() if paid != owed}
+
+
+def plan_greedy(net):
+    # Exactly opposite balances settle in one transfer each; everybody else
+    # is matched largest debtor to largest creditor using two heaps. At most
+    # one transfer per person, usually far fewer than paying pairwise.
+    transfers = []
+    waiting = {}  # amount -> names owed exactly that much
+    debtors = []
+    for name, amount in net.items():
+        if amount < 0:
+            if waiting.get(-amount):
+                transfers.append((name, waiting[-amount].pop(), -amount))
+            else:
+                debtors.append((amount, name))
+        elif amount > 0:
+            waiting.setdefault(amount, []).append(name)
+    creditors = [(-amount, name) for amount, names in waiting.items() for name in names]
+    heapq.heapify(debtors)
+    heapq.heapify(creditors)
+
+    while debtors and creditors:
+        debt, debtor = heapq.heappop(debtors)
+        credit, creditor = heapq.heappop(creditors)
+        paid = min(-debt, -credit)
+        transfers.append((debtor, creditor, paid))
+        if debt + paid:
+            heapq.heappush(debtors, (debt + paid, debtor))
+        if credit + paid:
+            heapq.heappush(creditors, (credit + paid, creditor))
+    return transfers
+
+
+def plan_exact(net):
+    # Fewest possible transfers: n people need n - k transfers, where k is the
+    # most groups they can be split into that each add up to zero. Found with
+    # a DP over all subsets, so only for small groups.
+    names = list(net)
+    if len(names) > EXACT_LIMIT:
+        raise ValueError(f"Exact planning is limited to {EXACT_LIMIT} people")
+    amounts = [net[name] for name in names]
+    full = (1 << len(names)) - 1
+    sums = [0] * (full + 1)
+    groups = [0] * (full + 1)
+    for mask in range(1, full + 1):
+        low = mask & -mask
+        sums[mask] = sums[mask ^ low] + amounts[low.bit_length() - 1]
+        best, rest = 0, mask
+        while rest:
+            bit = rest & -rest
+            if groups[mask ^ bit] > best:
+                best = groups[mask ^ bit]
+            rest ^= bit
+        groups[mask] = best + (sums[mask] == 0)
+
+    # Walk back down; each stretch between zero-sum masks is one group
+    transfers, group, mask = [], {}, full
+    while mask:
+        rest = mask
+        while rest:
+            bit = rest & -rest
+            if groups[mask ^ bit] + (sums[mask] == 0) == groups[mask]:
+                break
+            rest ^= bit
+        i = bit.bit_length() - 1
+        group[names[i]] = amounts[i]
+        mask ^= bit
+        if sums[mask] == 0:
+            transfers += plan_greedy(group)
+            group = {}
+    return transfers
+
+
+def plan_settlement(net, exact=False):
+    if exact and len(net) <= EXACT_LIMIT:
+        return plan_exact(net)
+    return plan_greedy(net)
+
+
+def print_transfers(transfers):
+    for debtor, creditor, amount in transfers:
+        print(f"{debtor} pays {creditor} ₹{format_paise(amount)}")
+    print(f"{len(transfers)} transfers")
+
+
+def random_ledger(members, expenses, seed=0):
+    rng = random.Random(seed)
+    names = [f"M{i}" for i in range(members)]
+    balances = {}
+    for _ in range(expenses):
+        group = rng.sample(names, rng.randint(2, min(8, members)))
+        add_expense(balances, group[0], rng.randint(100, 500_000), group)
+    return balances
+
+
+def settles(net, transfers):
+    # Applying every transfer must leave everybody square
+    left = dict(net)
+    for debtor, creditor, amount in transfers:
+        left[debtor] += amount
+        left[creditor] -= amount
+    return not any(left.values())
+
+
+def benchmark():
+    for members in (100, 1_000, 10_000):
+        balances = random_ledger(members, members * 20)
+        start = time.perf_counter()
+        net = net_balances(balances)
+        transfers = plan_greedy(net)
+        elapsed = time.perf_counter() - start
+
+        assert settles(net, transfers)
+        pairwise = sum(1 for amount in net.values() if amount < 0) * sum(1 for amount in net.values() if amount > 0)
+        print(f"{members:>6} members, {members * 20:>7} expenses: {len(transfers):>6} transfers "
+              f"(pairwise up to {pairwise:,}) in {elapsed * 1000:.1f} ms")
+
+    # Exact mode on small groups that hide zero-sum subgroups
+    rng = random.Random(1)
+    for size in (8, 12, 16, EXACT_LIMIT):
+        amounts = []
+        while len(amounts) < size:
+            part = [rng.randint(-5_000, 5_000) for _ in range(rng.randint(1, 3))]
+            amounts += part + [-sum(part)]
+        net = {f"M{i}": amount for i, amount in enumerate(amounts[:size - 1])}
+        net[f"M{size - 1}"] = -sum(net.values())
+        net = {name: amount for name, amount in net.items() if amount}
+        start = time.perf_counter()
+        exact = plan_exact(net)
+        elapsed = time.perf_counter() - start
+        assert settles(net, exact)
+        print(f"{len(net):>6} members: exact {len(exact)} transfers vs greedy {len(plan_greedy(net))} "
+              f"in {elapsed * 1000:.1f} ms")
+
+
+def print_ledger(balances):
+    print(f"{'Name':<20}{'Paid':>18}{'Share':>18}{'Net':>18}")
+    for name, (paid, owed) in sorted(balances.items()):
+        print(f"{name:<20}{format_paise(paid):>18}{format_paise(owed):>18}{format_paise(paid - owed):>18}")
+
+
+def get_amount(prompt):
     while True:
         try:
-            return float(input(prompt))
-        except ValueError:
+            return to_paise(input(prompt))
+        except (ArithmeticError, ValueError):
             print("❌ Please enter a valid number.")
 
-num_people = int(input("How many people are there in the group? "))
-names = []
 
-for i in range(num_people):
-    name = input(f"Enter the name for person #{i+1} ").strip()
-    names.append(name)
+def main():
+    num_people = int(input("How many people are there in the group? "))
+    names = []
+
+    for i in range(num_people):
+        name = input(f"Enter the name for person #{i+1} ").strip()
+        names.append(name)
+
+    total_bill = get_amount("Enter the bill amount in number only: ")
+
+    # Shares differ by at most one paisa and always add up to the bill
+    shares = split_amount(total_bill, [1] * num_people)
 
-total_bill = get_float("Enter the bill amount in number only: ")
+    print("\n" + "*" * 40)
+    print(f"\nTotal bill: {format_paise(total_bill)}")
+    print(f"Each person owes about {format_paise(shares[0])}")
 
-share = round(total_bill/num_people,2)
+    for name, share in zip(names, shares):
+        print(f"{name} owes {format_paise(share)} rupees")
+    print("\n" + "*" * 40)
 
-print("\n" + "*" * 40)
-print(f"\nTotal bill: {total_bill}")
-print(f"Each person owes {share}")
 
-for name in names:
-    print(f"{name} owes {share} rupees")
-print("\n" + "*" * 40)
\ No newline at end of file
+if __name__ == "__main__":
+    # python day3.py --ledger expenses.csv -> balances for a whole ledger
+    # python day3.py --settle expenses.csv [--exact] -> who pays whom
+    if len(sys.argv) > 2 and sys.argv[1] == "--ledger":
+        print_ledger(settle_csv(sys.argv[2]))
+    elif len(sys.argv) > 2 and sys.argv[1] == "--settle":
+        print_transfers(plan_settlement(net_balances(settle_csv(sys.argv[2])), "--exact" in sys.argv))
+    elif "--bench" in sys.argv:
+        benchmark()
+    else:
+        main()
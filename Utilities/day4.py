@@ -30,6 +30,14 @@ Bonus:
 - Let the user try again without restrating the program
 """
 
+import sys
+import csv
+import datetime
+import numpy as np
+
+BATCH_ROWS = 100_000  # CSV rows converted per NumPy chunk
+
+
 def calculate_minutes(age_years):
     DAYS_IN_YEAR = 365.25
     HOURS_IN_DAY = 24
@@ -42,25 +50,111 @@ def calculate_minutes(age_years):
     return round(total_days), round(total_hours), round(total_minutes)
 
 
-while True:
-    try:
-        age = float(input("Enter your age in years: "))
+def ages_in_minutes(birthdates, as_of, approximate=False):
+    # birthdates: datetime64[m] array. Exact mode counts the real minutes
+    # between the dates, leap days included; approximate mode takes the
+    # calendar age in whole years and applies 365.25 days/year like above.
+    if not approximate:
+        return (as_of - birthdates).astype(np.int64)
+    return np.round(calendar_years(birthdates, as_of) * 365.25 * 24 * 60).astype(np.int64)
 
-        if age < 0:
-            print("Age cannot be negative. Please try again.")
-            continue
 
-        days, hours, minutes = calculate_minutes(age)
+def calendar_years(birthdates, as_of):
+    # Whole years, minus one where this year's birthday (month, then the rest
+    # of the date) has not come yet
+    def month_and_rest(dates):
+        months = dates.astype("datetime64[M]")
+        return (months - dates.astype("datetime64[Y]")).astype(np.int64), (dates - months).astype(np.int64)
 
-        print("\nYou are approximately:")
-        print(f" - {days:,} days old")
-        print(f" - {hours:,} hours old")
-        print(f" - {minutes:,} minutes old")
+    years = (as_of.astype("datetime64[Y]") - birthdates.astype("datetime64[Y]")).astype(np.int64)
+    birth_month, birth_rest = month_and_rest(birthdates)
+    now_month, now_rest = month_and_rest(as_of)
+    before_birthday = (now_month < birth_month) | ((now_month == birth_month) & (now_rest < birth_rest))
+    return years - before_birthday
 
-        again = input("\nWould you like to try again? (y/n): ").strip().lower()
-        if again != 'y':
-            print("Goodbye! 👋")
-            break
 
+def parse_birthdates(values):
+    # Fast path parses the whole chunk in C; a bad value makes us fall back
+    # to one-by-one parsing so only that row is skipped (NaT)
+    try:
+        return np.array(values, dtype="datetime64[m]")
     except ValueError:
-        print("Please enter a valid numeric age!")
+        parsed = []
+        for value in values:
+            try:
+                parsed.append(np.datetime64(value.strip(), "m"))
+            except ValueError:
+                parsed.append(np.datetime64("NaT"))
+        return np.array(parsed, dtype="datetime64[m]")
+
+
+def convert_birthdates(src, dst, column="birthdate", as_of=None, approximate=False, chunk_rows=BATCH_ROWS):
+    # Streams src in chunks of rows, so memory stays bounded for any file size.
+    # Adds days/hours/minutes columns; rows with an unreadable date get blanks.
+    # Birthdates carry no time zone, so "now" has to be local time too
+    # (np.datetime64("now") would be UTC)
+    as_of = np.datetime64(as_of or datetime.datetime.now(), "m")
+    converted = skipped = 0
+    with open(src, "r", newline="", encoding="utf-8") as fin, \
+            open(dst, "w", newline="", encoding="utf-8") as fout:
+        reader = csv.reader(fin)
+        writer = csv.writer(fout)
+        header = next(reader)
+        position = [name.strip().lower() for name in header].index(column.lower())
+        writer.writerow(header + ["days", "hours", "minutes"])
+
+        while True:
+            rows = [row for _, row in zip(range(chunk_rows), reader)]
+            if not rows:
+                break
+            births = parse_birthdates([row[position] if len(row) > position else "" for row in rows])
+            valid = ~np.isnat(births)
+            minutes = ages_in_minutes(np.where(valid, births, as_of), as_of, approximate)
+            if approximate:
+                days, hours = np.round(minutes / 1440).astype(np.int64), np.round(minutes / 60).astype(np.int64)
+            else:
+                days, hours = minutes // 1440, minutes // 60
+
+            for row, ok, d, h, m in zip(rows, valid.tolist(), days.tolist(), hours.tolist(), minutes.tolist()):
+                # Pad short rows so the new values land under their own headers
+                padding = [""] * (len(header) - len(row))
+                writer.writerow(row + padding + ([d, h, m] if ok else ["", "", ""]))
+            valid_count = int(valid.sum())
+            converted += valid_count
+            skipped += len(rows) - valid_count
+    return converted, skipped
+
+
+def main():
+    while True:
+        try:
+            age = float(input("Enter your age in years: "))
+
+            if age < 0:
+                print("Age cannot be negative. Please try again.")
+                continue
+
+            days, hours, minutes = calculate_minutes(age)
+
+            print("\nYou are approximately:")
+            print(f" - {days:,} days old")
+            print(f" - {hours:,} hours old")
+            print(f" - {minutes:,} minutes old")
+
+            again = input("\nWould you like to try again? (y/n): ").strip().lower()
+            if again != 'y':
+                print("Goodbye! 👋")
+                break
+
+        except ValueError:
+            print("Please enter a valid numeric age!")
+
+
+if __name__ == "__main__":
+    # python day4.py                                    -> interactive
+    # python day4.py --batch people.csv out.csv [--approx] -> birthdate column to ages
+    if len(sys.argv) > 3 and sys.argv[1] == "--batch":
+        converted, skipped = convert_birthdates(sys.argv[2], sys.argv[3], approximate="--approx" in sys.argv)
+        print(f"Converted {converted:,} rows, skipped {skipped:,} with unreadable dates")
+    else:
+        main()
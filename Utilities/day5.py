@@ -21,6 +21,15 @@ Bonus:
 
 """
 
+import os
+import re
+import sys
+import json
+import time
+import tempfile
+from collections import deque
+from multiprocessing import Pool
+
 emoji_map_fun = {
     "happy": "😊",
     "love": "❤️",
@@ -30,18 +39,196 @@ emoji_map_fun = {
     "food": "🍔",
 }
 
-message = input("Enter your message : ")
 
-updated_words = []
+def trie_pattern(keywords):
+    # Keywords sharing a prefix share a branch ("c(?:ode|offee)"), so at each
+    # position the regex engine follows one path instead of retrying every
+    # keyword. Greedy optional tails keep the longest keyword first.
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [
+            (r"[^\S\n]+" if char == " " else re.escape(char)) + build(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def compile_emoji_matcher(emoji_map):
+    # Keywords may not touch other word characters or apostrophes ("unhappy",
+    # "happy's"); spaces inside keywords match any run of spaces or tabs, but
+    # never a line break.
+    lookup = {" ".join(keyword.lower().split()): emoji for keyword, emoji in emoji_map.items()}
+    lookup.pop("", None)  # a blank keyword would match the empty string everywhere
+    pattern = rf"(?<![\w'])(?:{trie_pattern(lookup)})(?![\w'])" if lookup else r"(?!)"
+    # Matching a lower-cased copy is faster than re.IGNORECASE; the second
+    # pattern covers the rare text whose length changes when lower-cased
+    return re.compile(pattern), re.compile(pattern, re.IGNORECASE), lookup
+
+
+DEFAULT_MATCHER = compile_emoji_matcher(emoji_map_fun)
+FILE_BLOCK = 1024 * 1024  # characters handed to the matcher at once in file mode
+MESSAGE_CHUNK = 10_000  # messages per task in the process pool
+
+matcher_cache = {}  # map file path -> (mtime_ns, compiled matcher)
+worker_matcher = None  # set once per pool worker by init_worker()
+
+
+def load_emoji_matcher(path):
+    # A JSON object of keyword -> emoji. Recompiled only when the file's
+    # mtime changes, so callers can ask for it before every chunk.
+    mtime = os.stat(path).st_mtime_ns
+    cached = matcher_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, "r", encoding="utf-8") as f:
+        emoji_map = json.load(f)
+    if not isinstance(emoji_map, dict):
+        raise ValueError(f"{path}: expected a JSON object of keyword -> emoji")
+    for keyword, emoji in emoji_map.items():
+        if not keyword.strip() or not isinstance(emoji, str):
+            raise ValueError(f"{path}: bad entry {keyword!r}: {emoji!r} "
+                             "(need a non-blank keyword and an emoji string)")
+    matcher = compile_emoji_matcher(emoji_map)
+    matcher_cache[path] = (mtime, matcher)
+    return matcher
+
+
+def enhance_message(message, matcher=DEFAULT_MATCHER):
+    regex, regex_ignorecase, lookup = matcher
+    lowered = message.lower()
+    if len(lowered) != len(message):
+        lowered, regex = message, regex_ignorecase
+
+    pieces = []
+    last = 0
+    for match in regex.finditer(lowered):
+        end = match.end()
+        pieces.append(message[last:end])
+        pieces.append(" " + lookup[" ".join(match.group().lower().split())])
+        last = end
+    pieces.append(message[last:])
+    return "".join(pieces)
+
+
+def init_worker(matcher):
+    # The matcher is pickled once per worker here, never once per message
+    global worker_matcher
+    worker_matcher = matcher
 
-for word in message.split():
-    cleaned = word.lower().strip(".,!?")
-    emoji = emoji_map_fun.get(cleaned, "")
-    if emoji:
-        updated_words.append(f"{word} {emoji}")
-    else:
-        updated_words.append(word)
 
-updated_message = " ".join(updated_words)
-print("\nEnhanced message: \n")
-print(updated_message)
\ No newline at end of file
+def enhance_chunk(messages):
+    return [enhance_message(message, worker_matcher) for message in messages]
+
+
+def chunked(messages, size):
+    chunk = []
+    for message in messages:
+        chunk.append(message)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def enhance_messages(messages, matcher=DEFAULT_MATCHER, map_path=None, workers=None,
+                     chunk_size=MESSAGE_CHUNK):
+    # Yields the enhanced messages in input order. With map_path, the map file
+    # is checked before every chunk and the pool restarts with the new matcher
+    # when it changed. At most two chunks per worker are in flight.
+    workers = workers or os.cpu_count() or 1
+    if map_path:
+        matcher = load_emoji_matcher(map_path)
+    if workers == 1:
+        for chunk in chunked(messages, chunk_size):
+            if map_path:
+                matcher = load_emoji_matcher(map_path)
+            yield from (enhance_message(message, matcher) for message in chunk)
+        return
+
+    pool = Pool(workers, initializer=init_worker, initargs=(matcher,))
+    pending = deque()
+    try:
+        for chunk in chunked(messages, chunk_size):
+            if map_path and load_emoji_matcher(map_path) is not matcher:
+                while pending:
+                    yield from pending.popleft().get()
+                pool.close()
+                pool.join()
+                matcher = load_emoji_matcher(map_path)
+                pool = Pool(workers, initializer=init_worker, initargs=(matcher,))
+            pending.append(pool.apply_async(enhance_chunk, (chunk,)))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+    finally:
+        pool.terminate()
+
+
+def enhance_file(src, dst, matcher=DEFAULT_MATCHER, map_path=None, workers=1):
+    # Whole lines in blocks of about FILE_BLOCK characters, so memory stays flat
+    # whatever the size of the chat export
+    lines = 0
+    with open(src, "r", encoding="utf-8", errors="replace") as fin, \
+            open(dst, "w", encoding="utf-8") as fout:
+        blocks = ("".join(block) for block in iter(lambda: fin.readlines(FILE_BLOCK), []))
+        for text in enhance_messages(blocks, matcher, map_path, workers, chunk_size=1):
+            fout.write(text)
+            lines += text.count("\n") + (not text.endswith("\n"))
+    return lines
+
+
+def benchmark(size_mb=1024):
+    sample = (
+        "I love to code and drink tea when I'm happy.\n"
+        "Lunch plans? Food truck at noon, then back to the release notes.\n"
+        "Music on, headphones in, shipping this feature today!\n"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        src, dst = os.path.join(tmp_dir, "chat.txt"), os.path.join(tmp_dir, "enhanced.txt")
+        block = sample * (1024 * 1024 // len(sample))
+        with open(src, "w", encoding="utf-8") as f:
+            for _ in range(size_mb):
+                f.write(block)
+        size = os.path.getsize(src) / (1024 * 1024)
+
+        start = time.perf_counter()
+        lines = enhance_file(src, dst)
+        elapsed = time.perf_counter() - start
+    print(f"{size:,.0f} MB, {lines:,} lines in {elapsed:.1f}s ({size / elapsed:.1f} MB/s)")
+
+
+def main():
+    message = input("Enter your message : ")
+    print("\nEnhanced message: \n")
+    print(enhance_message(message))
+
+
+if __name__ == "__main__":
+    # python day5.py                                      -> interactive
+    # python day5.py chat.txt out.txt [map.json] [workers] -> enhance a whole file
+    # python day5.py --bench [MB]                         -> throughput over a generated corpus
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 1024)
+    elif len(sys.argv) > 2:
+        map_path = sys.argv[3] if len(sys.argv) > 3 else None
+        workers = int(sys.argv[4]) if len(sys.argv) > 4 else 1
+        try:
+            lines = enhance_file(sys.argv[1], sys.argv[2], map_path=map_path, workers=workers)
+        except ValueError as e:
+            sys.exit(f"Bad emoji map: {e}")
+        print(f"Enhanced {lines:,} lines into {sys.argv[2]}")
+    else:
+        main()
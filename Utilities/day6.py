@@ -20,20 +20,305 @@ Today I learned about how list comprehensions work in python!
 Productivity Rating: 4/5
 """
 
+import os
+import sys
+import csv
+import time
+import queue
+import bisect
 import datetime
+import tempfile
+import threading
+import contextlib
 
-entry = input("What did you learn today? ").strip()
-rating = input("⭐ rate your productivity today(1-5,optional)").strip()
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, so keep to one writer there
+    fcntl = None
 
-now = datetime.datetime.now()
-date_str = now.strftime("%Y-%m-%d - %I:%M %p")
+JOURNAL_FILE = "learning_journal.txt"
+INDEX_FILE = "learning_journal.idx"  # timestamp, byte offset, length, rating per entry
+DATE_FORMAT = "%Y-%m-%d - %I:%M %p"
+DURABILITY_LEVELS = ("flush", "fsync_batch", "fsync_entry")
+QUEUE_LIMIT = 10_000  # entries waiting for the writer thread; log_entry() blocks past this
 
-journal_entry = f"\n 📅 {date_str}\n{entry}"
-if rating : 
-    journal_entry += f"\n Productivity Rating: {rating}\n"
-journal_entry += "\n" + "-" * 50
 
-with open ("learning_journal.txt", "a" , encoding = "utf-8") as f:
-    f.write(journal_entry)
+def format_entry(entry, rating, now):
+    journal_entry = f"\n 📅 {now.strftime(DATE_FORMAT)}\n{entry}"
+    if rating:
+        journal_entry += f"\n Productivity Rating: {rating}\n"
+    journal_entry += "\n" + "-" * 50
+    return journal_entry
 
-print(f"\n your journal entry has been saved to 'learning_journal'")
+
+@contextlib.contextmanager
+def journal_lock():
+    # Held around every append, so a menu add_entry() and any number of
+    # background writers never compute offsets from a stale end of file
+    with open(JOURNAL_FILE + ".lock", "a", encoding="utf-8") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def index_is_current():
+    # Only the last index row is needed: does it end where the journal ends?
+    journal_size = os.path.getsize(JOURNAL_FILE) if os.path.exists(JOURNAL_FILE) else 0
+    if not os.path.exists(INDEX_FILE):
+        return journal_size == 0
+    with open(INDEX_FILE, "rb") as f:
+        f.seek(max(os.path.getsize(INDEX_FILE) - 4096, 0))
+        lines = f.read().splitlines()
+    if not lines:
+        return journal_size == 0
+    stamp, offset, length, rating = next(csv.reader([lines[-1].decode("utf-8")]))
+    return int(offset) + int(length) == journal_size
+
+
+def add_entry(entry, rating="", now=None):
+    now = now or datetime.datetime.now()
+    data = format_entry(entry, rating, now).encode("utf-8")
+    with journal_lock():
+        if not index_is_current():
+            rebuild_index()
+        with open(JOURNAL_FILE, "ab") as f:
+            offset = f.tell()
+            f.write(data)
+        with open(INDEX_FILE, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow([now.isoformat(timespec="seconds"), offset, len(data), rating])
+
+
+def rebuild_index():
+    # For journals written before the sidecar existed: one scan for the 📅 lines
+    records = []
+    marker = " 📅 ".encode("utf-8")
+    if os.path.exists(JOURNAL_FILE):
+        with open(JOURNAL_FILE, "rb") as f:
+            offset = 0
+            for line in f:
+                if line.startswith(marker):
+                    stamp = datetime.datetime.strptime(line[len(marker):].decode("utf-8").strip(), DATE_FORMAT)
+                    # Each entry starts with the newline just before its 📅 line
+                    records.append([stamp.isoformat(timespec="seconds"), max(offset - 1, 0), 0, ""])
+                elif line.startswith(b" Productivity Rating: ") and records:
+                    records[-1][3] = line.split(b":", 1)[1].strip().decode("utf-8")
+                offset += len(line)
+        for current, following in zip(records, records[1:] + [[None, offset]]):
+            current[2] = following[1] - current[1]
+    with open(INDEX_FILE, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(records)
+    return records
+
+
+def load_index():
+    # Rebuilt only if the sidecar is missing or does not end where the journal does
+    records = []
+    if os.path.exists(INDEX_FILE):
+        with open(INDEX_FILE, "r", newline="", encoding="utf-8") as f:
+            records = [[stamp, int(offset), int(length), rating] for stamp, offset, length, rating in csv.reader(f)]
+    journal_size = os.path.getsize(JOURNAL_FILE) if os.path.exists(JOURNAL_FILE) else 0
+    indexed_size = records[-1][1] + records[-1][2] if records else 0
+    if indexed_size != journal_size:
+        records = rebuild_index()
+    return records
+
+
+def read_entries(records):
+    # Seek straight to each record instead of parsing the whole journal
+    entries = []
+    with open(JOURNAL_FILE, "rb") as f:
+        for stamp, offset, length, rating in records:
+            f.seek(offset)
+            entries.append(f.read(length).decode("utf-8").strip("\n"))
+    return entries
+
+
+def entries_between(start_date, end_date):
+    # Inclusive dates; entries are appended in time order, so bisect the index
+    records = load_index()
+    stamps = [record[0] for record in records]
+    low = bisect.bisect_left(stamps, start_date.isoformat())
+    high = bisect.bisect_left(stamps, (end_date + datetime.timedelta(days=1)).isoformat())
+    return read_entries(records[low:high])
+
+
+def entries_rated_at_least(min_rating):
+    records = load_index()
+    return read_entries([r for r in records if r[3].isdigit() and int(r[3]) >= min_rating])
+
+
+def last_entries(count):
+    return read_entries(load_index()[-count:] if count > 0 else [])
+
+
+def journal_writer_loop(entries, batch_size, flush_interval, durability):
+    # Keeps both files open and writes whatever has queued up as one batch,
+    # once batch_size entries are waiting or flush_interval seconds have passed.
+    # Each batch holds journal_lock() and starts from the real end of the
+    # journal, since other writers may have appended since the last batch.
+    with open(JOURNAL_FILE, "ab") as journal, open(INDEX_FILE, "a", newline="", encoding="utf-8") as index:
+        rows = csv.writer(index)
+        stopping = False
+        while not stopping:
+            batch = [entries.get()]
+            deadline = time.monotonic() + flush_interval
+            while len(batch) < batch_size and batch[-1] is not None:
+                try:
+                    batch.append(entries.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                stopping = True
+                batch.pop()
+
+            if not batch:
+                continue
+            with journal_lock():
+                if not index_is_current():
+                    rebuild_index()
+                offset = journal.seek(0, os.SEEK_END)
+                for entry, rating, now in batch:
+                    data = format_entry(entry, rating, now).encode("utf-8")
+                    journal.write(data)
+                    if durability == "fsync_entry":
+                        journal.flush()
+                        os.fsync(journal.fileno())
+                    rows.writerow([now.isoformat(timespec="seconds"), offset, len(data), rating])
+                    offset += len(data)
+                journal.flush()
+                if durability == "fsync_batch":
+                    os.fsync(journal.fileno())
+                # The index goes out after the journal, so a crash can only leave it
+                # short, and a short index is rebuilt on the next load
+                index.flush()
+                if durability != "flush":
+                    os.fsync(index.fileno())
+
+
+def journal_writer_thread(writer, batch_size, flush_interval, durability):
+    # An exception would otherwise die with the thread; keep it for the caller
+    try:
+        journal_writer_loop(writer["queue"], batch_size, flush_interval, durability)
+    except Exception as e:
+        writer["error"] = e
+
+
+def start_journal_writer(batch_size=500, flush_interval=0.2, durability="flush"):
+    if durability not in DURABILITY_LEVELS:
+        raise ValueError(f"durability must be one of {', '.join(DURABILITY_LEVELS)}")
+    writer = {"queue": queue.Queue(maxsize=QUEUE_LIMIT), "error": None}
+    writer["thread"] = threading.Thread(
+        target=journal_writer_thread,
+        args=(writer, batch_size, flush_interval, durability),
+        daemon=True,
+    )
+    writer["thread"].start()
+    return writer
+
+
+def put_for_writer(writer, item):
+    # Waits while the queue is full, but gives up as soon as the writer has failed
+    while writer["error"] is None:
+        try:
+            writer["queue"].put(item, timeout=0.1)
+            return
+        except queue.Full:
+            pass
+    raise writer["error"]
+
+
+def log_entry(writer, entry, rating=""):
+    put_for_writer(writer, (entry, rating, datetime.datetime.now()))
+
+
+def stop_journal_writer(writer):
+    # Everything queued before the call is written before it returns
+    put_for_writer(writer, None)
+    writer["thread"].join()
+    if writer["error"] is not None:
+        raise writer["error"]
+
+
+def benchmark_writer(count=20_000):
+    global JOURNAL_FILE, INDEX_FILE
+    saved = JOURNAL_FILE, INDEX_FILE
+    try:
+        for mode in ("open per entry",) + DURABILITY_LEVELS:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                JOURNAL_FILE = os.path.join(tmp_dir, "learning_journal.txt")
+                INDEX_FILE = os.path.join(tmp_dir, "learning_journal.idx")
+                # fsync per entry is slow enough that a sample says as much
+                n = count // 20 if mode == "fsync_entry" else count
+                start = time.perf_counter()
+                if mode == "open per entry":
+                    for i in range(n):
+                        add_entry(f"activity {i}", str(i % 5 + 1))
+                else:
+                    writer = start_journal_writer(durability=mode)
+                    for i in range(n):
+                        log_entry(writer, f"activity {i}", str(i % 5 + 1))
+                    stop_journal_writer(writer)
+                elapsed = time.perf_counter() - start
+                assert len(load_index()) == n
+            print(f"{mode:>15}: {n / elapsed:10,.0f} entries/s")
+    finally:
+        JOURNAL_FILE, INDEX_FILE = saved
+
+
+def write_entry():
+    entry = input("What did you learn today? ").strip()
+    rating = input("⭐ rate your productivity today(1-5,optional)").strip()
+    add_entry(entry, rating)
+    print(f"\n your journal entry has been saved to 'learning_journal'")
+
+
+def show_entries(entries):
+    if not entries:
+        print("No matching entries")
+    for journal_entry in entries:
+        print(journal_entry)
+
+
+def main():
+    print("1. Write today's entry")
+    print("2. Entries between two dates")
+    print("3. Entries rated at least N")
+    print("4. Last K entries")
+    choice = input("Choose an option (1-4) [1]: ").strip() or "1"
+
+    try:
+        match choice:
+            case "1":
+                write_entry()
+            case "2":
+                start = datetime.date.fromisoformat(input("From (YYYY-MM-DD): ").strip())
+                end = datetime.date.fromisoformat(input("To (YYYY-MM-DD): ").strip())
+                show_entries(entries_between(start, end))
+            case "3":
+                show_entries(entries_rated_at_least(int(input("Minimum rating (1-5): "))))
+            case "4":
+                show_entries(last_entries(int(input("How many entries? "))))
+            case _:
+                print("Please choose a valid option (1-4).")
+    except ValueError:
+        print("Please enter a valid date or number.")
+
+
+if __name__ == "__main__":
+    # python day6.py                       -> menu
+    # some_script | python day6.py --log   -> every input line becomes an entry
+    # python day6.py --bench               -> batched writer vs one open per entry
+    if "--bench" in sys.argv:
+        benchmark_writer()
+    elif "--log" in sys.argv:
+        writer = start_journal_writer()
+        for line in sys.stdin:
+            if line.strip():
+                log_entry(writer, line.strip())
+        stop_journal_writer(writer)
+    else:
+        main()
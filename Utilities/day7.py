@@ -33,29 +33,428 @@ Bonus:
 """
 
 import os
+import re
+import sys
+import random
+import itertools
+import contextlib
+import multiprocessing
+import time
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, so keep to one terminal there
+    fcntl = None
 
 TASK_FILE = "tasks.txt"
+TASK_LOG = "tasks.log"
+LOCK_FILE = "tasks.lock"
+COMPACT_BYTES = 1024 * 1024  # fold the log into TASK_FILE once it grows past this
+# First line of TASK_FILE and of TASK_LOG. Every compaction bumps the
+# generation in both, so a terminal that slept through any number of
+# compactions sees that its log position belongs to an older log.
+SNAPSHOT_HEADER = re.compile(r"#next_id (\d+)(?: generation (\d+))?")
+LOG_HEADER = re.compile(r"#generation (\d+)")
 
+next_id = 1
+generation = 0  # of the snapshot last read or written
+log_state = {"generation": None, "offset": 0}  # which TASK_LOG we follow and how far we read it
 
-def load_tasks():
+
+@contextlib.contextmanager
+def task_lock():
+    # Held only around "catch up + append", never while waiting on input()
+    with open(LOCK_FILE, "a", encoding="utf-8") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def task_files(folder):
+    # Point the store at another folder (benchmarks, stress test)
+    global TASK_FILE, TASK_LOG, LOCK_FILE
+    saved = TASK_FILE, TASK_LOG, LOCK_FILE
+    TASK_FILE, TASK_LOG, LOCK_FILE = (
+        os.path.join(folder, name) for name in ("tasks.txt", "tasks.log", "tasks.lock")
+    )
+    try:
+        yield
+    finally:
+        TASK_FILE, TASK_LOG, LOCK_FILE = saved
+
+
+def parse_task_line(line):
+    # Snapshot lines are "text || status || id"; older files have no id
+    parts = line.rstrip("\n").rsplit(" || ", 2)
+    if len(parts) == 3 and parts[2].isdigit() and parts[1] in ("done", "not_done"):
+        return int(parts[2]), parts[0], parts[1] == "done"
+    text, status = line.rstrip("\n").rsplit(" || ", 1)
+    return None, text, status == "done"
+
+
+def read_snapshot():
+    global next_id, generation
     tasks = []
+    generation = 0
     if os.path.exists(TASK_FILE):
         with open(TASK_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                if " || " in line:
-                    text, status = line.strip().rsplit(" || ", 1)
-                    tasks.append({
-                        "text": text,
-                        "done": status == "done"
-                    })
+            for line_no, line in enumerate(f):
+                header = SNAPSHOT_HEADER.fullmatch(line.rstrip("\n")) if line_no == 0 else None
+                if header:
+                    next_id = max(next_id, int(header.group(1)))
+                    generation = int(header.group(2) or 0)
+                elif " || " in line:
+                    task_id, text, done = parse_task_line(line)
+                    if task_id is None:
+                        task_id = len(tasks) + 1
+                    tasks.append({"id": task_id, "text": text, "done": done})
+                    next_id = max(next_id, task_id + 1)
     return tasks
 
 
+def read_log_records(offset):
+    # Offsets are in bytes so another process can resume exactly where we stopped
+    records = []
+    if not os.path.exists(TASK_LOG):
+        return records, offset
+    with open(TASK_LOG, "rb") as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            offset += len(raw)
+            line = raw.decode("utf-8").rstrip("\n")
+            if " || " in line:
+                records.append(line.split(" || ", 1))
+    return records, offset
+
+
+def apply_record(index, op, rest):
+    # Every record is idempotent, so replaying over a fresh snapshot is safe
+    global next_id
+    if op == "add":
+        task_id, text = rest.split(" || ", 1)
+        task_id = int(task_id)
+        if task_id not in index["by_id"]:
+            index_task(index, {"id": task_id, "text": text, "done": False})
+        next_id = max(next_id, task_id + 1)
+    elif op == "done" and int(rest) in index["by_id"]:
+        mark_done(index, int(rest))
+    elif op == "delete" and int(rest) in index["by_id"]:
+        unindex_task(index, index["by_id"][int(rest)])
+
+
+def log_generation():
+    # None when there is no log; logs from before generations existed are 0
+    try:
+        with open(TASK_LOG, "rb") as f:
+            first = f.readline().decode("utf-8").rstrip("\n")
+    except FileNotFoundError:
+        return None
+    header = LOG_HEADER.fullmatch(first)
+    return int(header.group(1)) if header else 0
+
+
+def start_log():
+    with open(TASK_LOG + ".tmp", "w", encoding="utf-8") as f:
+        f.write(f"#generation {generation}\n")
+    os.replace(TASK_LOG + ".tmp", TASK_LOG)
+
+
+def load_index():
+    # Callers hold task_lock()
+    global next_id
+    next_id = 1
+    index = build_index(read_snapshot())
+    if log_generation() != generation:
+        # Missing, or left from before a compaction that stopped between
+        # writing the snapshot and swapping the log: its records are
+        # already in the snapshot
+        start_log()
+    log_state["generation"], log_state["offset"] = generation, 0
+    replay_new_records(index)
+    return index
+
+
+def replay_new_records(index):
+    records, log_state["offset"] = read_log_records(log_state["offset"])
+    for op, rest in records:
+        apply_record(index, op, rest)
+
+
+def sync_index(index):
+    # Pick up what other terminals appended since we last looked. A new log
+    # generation means somebody compacted, so start again from the snapshot.
+    if log_generation() != log_state["generation"]:
+        index.update(load_index())
+    else:
+        replay_new_records(index)
+
+
+def refresh_index(index):
+    with task_lock():
+        sync_index(index)
+
+
+def load_tasks():
+    with task_lock():
+        return list(load_index()["by_id"].values())
+
+
 def save_tasks(tasks):
-    with open(TASK_FILE, "w", encoding="utf-8") as f:
+    # Full rewrite: used for compaction, the log is swapped for an empty one
+    # once the snapshot is in place. Callers hold task_lock().
+    global generation
+    generation += 1
+    tmp_file = TASK_FILE + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write(f"#next_id {next_id} generation {generation}\n")
         for task in tasks:
             status = "done" if task["done"] else "not_done"
-            f.write(f"{task['text']} || {status}\n")
+            f.write(f"{task['text']} || {status} || {task['id']}\n")
+    os.replace(tmp_file, TASK_FILE)
+
+    start_log()
+    log_state["generation"], log_state["offset"] = generation, 0
+
+
+def append_log(index, record):
+    # Callers hold task_lock() and have just synced, so our offset is the end of the log
+    with open(TASK_LOG, "ab") as f:
+        if f.tell() == 0:  # the log was removed under us
+            f.write(f"#generation {generation}\n".encode("utf-8"))
+        f.write((record + "\n").encode("utf-8"))
+        log_state["offset"] = f.tell()
+    if log_state["offset"] > COMPACT_BYTES:
+        save_tasks(index["by_id"].values())
+
+
+def tokenize(text):
+    return set(re.findall(r"\w+", text.lower()))
+
+
+def status_of(task):
+    return "done" if task["done"] else "not_done"
+
+
+def build_index(tasks):
+    # Posting "lists" are dicts used as insertion-ordered sets of task ids
+    index = {"by_id": {}, "status": {"done": {}, "not_done": {}}, "tokens": {}}
+    for task in tasks:
+        index_task(index, task)
+    return index
+
+
+def index_task(index, task):
+    index["by_id"][task["id"]] = task
+    index["status"][status_of(task)][task["id"]] = None
+    for token in tokenize(task["text"]):
+        index["tokens"].setdefault(token, {})[task["id"]] = None
+
+
+def unindex_task(index, task):
+    del index["by_id"][task["id"]]
+    del index["status"][status_of(task)][task["id"]]
+    for token in tokenize(task["text"]):
+        postings = index["tokens"][token]
+        del postings[task["id"]]
+        if not postings:
+            del index["tokens"][token]
+
+
+def query_tasks(index, status=None, text="", page=1, page_size=10):
+    # Walk the shortest posting list and stop as soon as the page is full,
+    # so the cost follows the page (and its offset), not the whole task list
+    postings = []
+    if status:
+        postings.append(index["status"][status])
+    for token in tokenize(text):
+        postings.append(index["tokens"].get(token, {}))
+    if not postings:
+        postings.append(index["by_id"])
+    postings.sort(key=len)
+    smallest, others = postings[0], postings[1:]
+
+    matches = (task_id for task_id in smallest if all(task_id in p for p in others))
+    offset = (page - 1) * page_size
+    found = list(itertools.islice(matches, offset, offset + page_size + 1))
+    has_more = len(found) > page_size
+    return [index["by_id"][task_id] for task_id in found[:page_size]], has_more
+
+
+def mark_done(index, task_id):
+    task = index["by_id"][task_id]
+    if not task["done"]:
+        del index["status"]["not_done"][task_id]
+        task["done"] = True
+        index["status"]["done"][task_id] = None
+    return task
+
+
+def add_task(index, text):
+    global next_id
+    with task_lock():
+        sync_index(index)
+        task = {"id": next_id, "text": text, "done": False}
+        next_id += 1
+        index_task(index, task)
+        append_log(index, f"add || {task['id']} || {text}")
+    return task
+
+
+def complete_task(index, task_id):
+    # Re-read first: another terminal may have deleted the task meanwhile
+    with task_lock():
+        sync_index(index)
+        if task_id not in index["by_id"]:
+            return None
+        task = mark_done(index, task_id)
+        append_log(index, f"done || {task_id}")
+    return task
+
+
+def delete_task(index, task_id):
+    with task_lock():
+        sync_index(index)
+        if task_id not in index["by_id"]:
+            return None
+        task = index["by_id"][task_id]
+        unindex_task(index, task)
+        append_log(index, f"delete || {task_id}")
+    return task
+
+
+def benchmark_operations(sizes=(1_000, 10_000, 100_000, 1_000_000), ops=20_000):
+    # Per-operation latency of the journal should stay flat as the list grows.
+    # ops is large enough for the log to pass COMPACT_BYTES, so the max column
+    # shows the add/done/delete that had to compact the whole store in the foreground.
+    with tempfile.TemporaryDirectory() as tmp_dir, task_files(tmp_dir):
+        print(f"{'tasks':>10} | {'operation':>9} | {'mean (us)':>9} | {'p99 (us)':>9} | {'max (us)':>10} | compactions")
+        for size in sizes:
+            with task_lock():
+                save_tasks([{"id": i, "text": f"task {i}", "done": False} for i in range(1, size + 1)])
+                index = load_index()
+            for name, operation in (
+                ("add", lambda i: add_task(index, f"benchmark task {i}")),
+                ("done", lambda i: complete_task(index, size // 2 + i)),
+                ("delete", lambda i: delete_task(index, size // 3 + i)),
+                ("page", lambda i: query_tasks(index, "not_done", "benchmark task", page=1 + i % 5)),
+            ):
+                timings = []
+                compactions = 0
+                for i in range(ops):
+                    start = time.perf_counter()
+                    operation(i)
+                    timings.append((time.perf_counter() - start) * 1_000_000)
+                    if log_state["offset"] == 0:  # this call rewrote TASK_FILE
+                        compactions += 1
+                timings.sort()
+                print(
+                    f"{size:>10,} | {name:>9} | {sum(timings) / ops:>9.1f} | "
+                    f"{timings[ops * 99 // 100]:>9.1f} | {timings[-1]:>10.1f} | {compactions}"
+                )
+
+
+def stress_worker(args):
+    folder, worker, ops = args
+    global COMPACT_BYTES
+    COMPACT_BYTES = 16 * 1024  # compact often so other workers keep hitting a swapped log
+    rng = random.Random(worker)
+    added, completed, deleted = [], [], []
+    with task_files(folder):
+        with task_lock():
+            index = load_index()
+        for i in range(ops):
+            action = rng.random()
+            if action < 0.5 or not index["by_id"]:
+                added.append(add_task(index, f"worker {worker} task {i}")["id"])
+                continue
+            task_id = rng.choice(list(index["by_id"]))
+            if action < 0.8:
+                if complete_task(index, task_id):
+                    completed.append(task_id)
+            elif delete_task(index, task_id):
+                deleted.append(task_id)
+    return added, completed, deleted
+
+
+def compacting_worker(args):
+    # Adds tasks and compacts the store `rounds` times, then leaves a short
+    # log behind; returns the ids it added
+    folder, rounds, ops = args
+    added = []
+    with task_files(folder):
+        with task_lock():
+            index = load_index()
+        for _ in range(rounds):
+            added += [add_task(index, f"compacting task {i}")["id"] for i in range(ops)]
+            with task_lock():
+                sync_index(index)
+                save_tasks(index["by_id"].values())
+        added += [add_task(index, f"after compaction {i}")["id"] for i in range(3)]
+    return added
+
+
+def sleeper_test(folder, processes=1):
+    # One terminal writes a long log, then sleeps through two compactions done
+    # by another process, which leave a log shorter than where it stopped
+    # reading. Its next adds must still get fresh ids.
+    with task_files(folder):
+        with task_lock():
+            index = load_index()
+        added = [add_task(index, f"before the nap {i}")["id"] for i in range(100)]
+        with multiprocessing.Pool(processes) as pool:
+            added += pool.apply(compacting_worker, ((folder, 2, 50),))
+        added += [add_task(index, f"after the nap {i}")["id"] for i in range(5)]
+        with task_lock():
+            stored = set(load_index()["by_id"])
+    problems = []
+    if len(added) != len(set(added)):
+        problems.append("the sleeping terminal reused a task id")
+    if stored != set(added):
+        problems.append(f"{len(stored ^ set(added))} task(s) lost after sleeping through compactions")
+    return problems
+
+
+def stress_test(processes=8, ops=300):
+    # N terminals hammering one store: no id may be handed out twice and no update may be lost
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start = time.perf_counter()
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(stress_worker, [(tmp_dir, worker, ops) for worker in range(processes)])
+        elapsed = time.perf_counter() - start
+        added = [task_id for result in results for task_id in result[0]]
+        completed = {task_id for result in results for task_id in result[1]}
+        deleted = [task_id for result in results for task_id in result[2]]
+
+        with task_files(tmp_dir), task_lock():
+            index = load_index()
+
+    expected = set(added) - set(deleted)
+    problems = []
+    if len(added) != len(set(added)):
+        problems.append("the same task id was handed out twice")
+    if len(deleted) != len(set(deleted)):
+        problems.append("a task was deleted twice")
+    if set(index["by_id"]) != expected:
+        problems.append(f"{len(set(index['by_id']) ^ expected)} task(s) lost or resurrected")
+    if any(not index["by_id"][task_id]["done"] for task_id in completed & expected):
+        problems.append("a completed task is not marked done")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        problems += sleeper_test(tmp_dir)
+
+    print(f"{processes} processes x {ops} ops in {elapsed:.2f}s "
+          f"({processes * ops / elapsed:,.0f} ops/s): "
+          f"{len(added)} added, {len(completed)} completed, {len(deleted)} deleted")
+    print("Problems: " + "; ".join(problems) if problems else "No lost updates.")
+    return not problems
 
 
 def display_tasks(tasks):
@@ -63,14 +462,50 @@ def display_tasks(tasks):
         print("NO TASKS FOUND")
     else:
         print("\nYour tasks:")
-        for i, task in enumerate(tasks, 1):
+        for task in tasks:
             checkbox = "✔️" if task["done"] else " "
-            print(f"{i}. [{checkbox}] {task['text']}")
+            print(f"#{task['id']}. [{checkbox}] {task['text']}")
     print()
 
 
+def view_tasks(index, status=None):
+    if status is None:
+        choice = input("Show (a)ll, (o)pen or (d)one tasks? [a]: ").strip().lower()
+        status = {"o": "not_done", "d": "done"}.get(choice)
+    text = input("Only tasks matching (leave empty for all): ").strip()
+
+    page = 1
+    while True:
+        tasks, has_more = query_tasks(index, status, text, page)
+        print(f"\n--- Page {page} ---")
+        display_tasks(tasks)
+        options = (["(n)ext"] if has_more else []) + (["(p)revious"] if page > 1 else [])
+        if not options:
+            return
+        move = input(f"{', '.join(options)} or Enter to stop: ").strip().lower()
+        if move == "n" and has_more:
+            page += 1
+        elif move == "p" and page > 1:
+            page -= 1
+        else:
+            return
+
+
+def ask_task_id(index, prompt):
+    try:
+        task_id = int(input(prompt).strip().lstrip("#"))
+    except ValueError:
+        print("Please enter a valid number.")
+        return None
+    if task_id not in index["by_id"]:
+        print("Invalid task number.")
+        return None
+    return task_id
+
+
 def task_manager():
-    tasks = load_tasks()
+    with task_lock():
+        index = load_index()
 
     while True:
         print("\n----- Task List Manager -----")
@@ -81,53 +516,47 @@ def task_manager():
         print("5. Exit")
 
         choice = input("Choose an option (1-5): ").strip()
+        refresh_index(index)  # show what other terminals changed meanwhile
 
         match choice:
             case "1":
                 text = input("Enter your task: ").strip()
                 if text:
-                    tasks.append({"text": text, "done": False})
-                    save_tasks(tasks)
-                    print("Task added successfully.")
+                    task = add_task(index, text)
+                    print(f"Task #{task['id']} added successfully.")
                 else:
                     print("Task cannot be empty!")
 
             case "2":
-                display_tasks(tasks)
+                view_tasks(index)
 
             case "3":
-                if not tasks:
+                if not index["status"]["not_done"]:
                     print("No tasks to complete.")
                     continue
 
-                display_tasks(tasks)
-                try:
-                    num = int(input("Enter task number: "))
-                    if 1 <= num <= len(tasks):
-                        tasks[num - 1]["done"] = True
-                        save_tasks(tasks)
-                        print("Task marked as DONE.")
-                    else:
-                        print("Invalid task number.")
-                except ValueError:
-                    print("Please enter a valid number.")
+                view_tasks(index, "not_done")
+                task_id = ask_task_id(index, "Enter task number: ")
+                if task_id is None:
+                    continue
+                if complete_task(index, task_id):
+                    print("Task marked as DONE.")
+                else:
+                    print("Task was removed from another terminal.")
 
             case "4":
-                if not tasks:
+                if not index["by_id"]:
                     print("No tasks to delete.")
                     continue
 
-                display_tasks(tasks)
-                try:
-                    num = int(input("Enter task number to delete: "))
-                    if 1 <= num <= len(tasks):
-                        tasks.pop(num - 1)
-                        save_tasks(tasks)
-                        print("Task removed successfully.")
-                    else:
-                        print("Invalid task number.")
-                except ValueError:
-                    print("Please enter a valid number.")
+                view_tasks(index, "")
+                task_id = ask_task_id(index, "Enter task number to delete: ")
+                if task_id is None:
+                    continue
+                if delete_task(index, task_id):
+                    print("Task removed successfully.")
+                else:
+                    print("Task was already removed from another terminal.")
 
             case "5":
                 print("Exiting Task Manager. Goodbye!")
@@ -138,4 +567,9 @@ def task_manager():
 
 
 if __name__ == "__main__":
-    task_manager()
+    if "--bench" in sys.argv:
+        benchmark_operations()
+    elif "--stress" in sys.argv:
+        sys.exit(0 if stress_test() else 1)
+    else:
+        task_manager()
@@ -18,38 +18,370 @@ Bonus:
 - Hide password input using 'getpass' (no echo on screen).
 """
 
+import os
+import mmap
+import heapq
 import string
-import random
+import struct
 import getpass
+import hashlib
+import sys
+import tempfile
+from multiprocessing import Pool
+import numpy as np
+
+TOO_SHORT, NO_LOWER, NO_UPPER, NO_DIGIT, NO_SPECIAL = 1, 2, 4, 8, 16
+ISSUES = {
+    TOO_SHORT: "Too short (8 minimum 8 characters)",
+    NO_LOWER: "Missing lower case letter",
+    NO_UPPER: "Missing upper case letter",
+    NO_DIGIT: "Missing digit",
+    NO_SPECIAL: "Missing a special character",
+}
+
+# ASCII passwords are translated to class markers in one C-level pass:
+# a/A/0/! for the four character classes and "." for anything else. The set of
+# markers left over tells us everything that is missing.
+CLASS_TABLE = str.maketrans(
+    string.ascii_lowercase + string.ascii_uppercase + string.digits + string.punctuation,
+    "a" * 26 + "A" * 26 + "0" * 10 + "!" * len(string.punctuation),
+)
+CLASS_TABLE = {code: chr(CLASS_TABLE[code]) if code in CLASS_TABLE else "." for code in range(128)}
+MISSING_BY_CLASSES = {}
+for bits in range(32):
+    classes = frozenset(marker for bit, marker in enumerate("aA0!.") if bits >> bit & 1)
+    MISSING_BY_CLASSES[classes] = (
+        (NO_LOWER if "a" not in classes else 0)
+        | (NO_UPPER if "A" not in classes else 0)
+        | (NO_DIGIT if "0" not in classes else 0)
+        | (NO_SPECIAL if "!" not in classes else 0)
+    )
+
+# Bulk audits do the same per byte with NumPy: each byte becomes a class bit
+# and a line's classes are the OR of its bytes. Bit 16 flags non-ASCII bytes,
+# whose lines go through password_issues() instead.
+BYTE_CLASS = np.zeros(256, dtype=np.uint8)
+for chars, bit in ((string.ascii_lowercase, 1), (string.ascii_uppercase, 2),
+                   (string.digits, 4), (string.punctuation, 8)):
+    BYTE_CLASS[np.frombuffer(chars.encode(), np.uint8)] = bit
+BYTE_CLASS[128:] = 16
+MISSING_BY_BITS = np.array([
+    MISSING_BY_CLASSES[frozenset(marker for bit, marker in enumerate("aA0!") if bits >> bit & 1)]
+    for bits in range(16)
+], dtype=np.uint8)
+AUDIT_CHUNK = 16 * 1024 * 1024
+
+BREACH_BLOOM = "breached.bloom"
+BREACH_HASHES = "breached.sha1"  # sorted raw 20-byte SHA-1 digests
+BREACH_MAGIC = b"PWBLOOM1"
+BREACH_ISSUE = "Found in a list of breached passwords"
+BREACH_INDEX = None  # set by load_breach_index()
+
+
+def password_issues(password):
+    # Bit mask of ISSUES keys, 0 for a strong password
+    mask = TOO_SHORT if len(password) < 8 else 0
+    if password.isascii():
+        return mask | MISSING_BY_CLASSES[frozenset(password.translate(CLASS_TABLE))]
+
+    missing = NO_LOWER | NO_UPPER | NO_DIGIT | NO_SPECIAL
+    for c in password:
+        if c.islower():
+            missing &= ~NO_LOWER
+        elif c.isupper():
+            missing &= ~NO_UPPER
+        elif c.isdigit():
+            missing &= ~NO_DIGIT
+        elif c in string.punctuation:
+            missing &= ~NO_SPECIAL
+    return mask | missing
+
 
 def check_password_strength(password):
-    issues = []
-    if len(password) < 8:
-        issues.append("Too short (8 minimum 8 characters)")
-    if not any(c.islower() for c in password):
-        issues.append("Missing lower case letter")
-    if not any(c.isupper() for c in password):
-        issues.append("Missing upper case letter")
-    if not any(c.isdigit() for c in password):
-        issues.append("Missing digit")
-    if not any(c in string.punctuation for c in password):
-        issues.append("Missing a special character")
+    mask = password_issues(password)
+    issues = [message for bit, message in ISSUES.items() if mask & bit]
+    if BREACH_INDEX and is_breached(password):
+        issues.append(BREACH_ISSUE)
     return issues
 
+
+def read_hash_runs(source, run_dir, run_size):
+    # Parse "HEX" or "HEX:count" lines into sorted runs of raw digests on disk
+    runs = []
+    with open(source, "rb") as f:
+        while True:
+            lines = f.readlines(run_size * 42)
+            if not lines:
+                break
+            hexes = b"".join(line[:40] for line in lines if len(line.rstrip()) >= 40)
+            digests = np.unique(np.frombuffer(bytes.fromhex(hexes.decode("ascii")), "S20"))
+            runs.append(os.path.join(run_dir, f"run{len(runs)}"))
+            digests.tofile(runs[-1])
+    return runs
+
+
+def iter_digests(path, block=1 << 16):
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(20 * block)
+            if not data:
+                return
+            for i in range(0, len(data), 20):
+                yield data[i:i + 20]
+
+
+def bloom_positions(digests, bits, hashes):
+    # SHA-1 is already uniform, so two 64-bit words of the digest drive
+    # double hashing: position i = h1 + i * h2 (mod bits)
+    h1 = digests[:, :8].copy().view("<u8").ravel()
+    h2 = digests[:, 8:16].copy().view("<u8").ravel() | np.uint64(1)
+    for i in range(hashes):
+        yield (h1 + np.uint64(i) * h2) % np.uint64(bits)
+
+
+def build_breach_index(source, bloom_path=BREACH_BLOOM, hashes_path=BREACH_HASHES,
+                       false_positive_rate=0.001, run_size=20_000_000):
+    # Sort in runs that fit in memory, merge them into the exact hash file,
+    # then stream that file once to fill the Bloom filter
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(hashes_path))) as run_dir:
+        runs = read_hash_runs(source, run_dir, run_size)
+        if len(runs) == 1:
+            os.replace(runs[0], hashes_path)
+        else:
+            with open(hashes_path, "wb") as out:
+                previous = None
+                for digest in heapq.merge(*(iter_digests(run) for run in runs)):
+                    if digest != previous:
+                        out.write(digest)
+                        previous = digest
+    if not runs:
+        open(hashes_path, "wb").close()
+
+    count = os.path.getsize(hashes_path) // 20
+    bits = max(64, int(-count * np.log(false_positive_rate) / np.log(2) ** 2))
+    hashes = max(1, round(bits / max(count, 1) * np.log(2)))
+    bloom = np.zeros((bits + 7) // 8, dtype=np.uint8)
+    with open(hashes_path, "rb") as f:
+        while True:
+            data = f.read(20 * 1_000_000)
+            if not data:
+                break
+            digests = np.frombuffer(data, np.uint8).reshape(-1, 20)
+            for positions in bloom_positions(digests, bits, hashes):
+                np.bitwise_or.at(bloom, positions >> np.uint64(3),
+                                 np.left_shift(1, positions & np.uint64(7)).astype(np.uint8))
+
+    with open(bloom_path, "wb") as f:
+        f.write(struct.pack("<8sQQ", BREACH_MAGIC, bits, hashes))
+        f.write(bloom.tobytes())
+    return count
+
+
+def load_breach_index(bloom_path=BREACH_BLOOM, hashes_path=BREACH_HASHES):
+    # Startup is just two mmaps; nothing is read until a lookup touches it
+    global BREACH_INDEX
+    if not (os.path.exists(bloom_path) and os.path.exists(hashes_path)):
+        return None
+    with open(bloom_path, "rb") as f:
+        bloom = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, bits, hashes = struct.unpack_from("<8sQQ", bloom)
+    if magic != BREACH_MAGIC:
+        raise ValueError(f"{bloom_path} is not a breached-password Bloom filter")
+    digests = None
+    if os.path.getsize(hashes_path):
+        with open(hashes_path, "rb") as f:
+            digests = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    BREACH_INDEX = {"bloom": bloom, "bits": bits, "hashes": hashes, "digests": digests}
+    return BREACH_INDEX
+
+
+def is_breached(password, index=None):
+    index = index or BREACH_INDEX
+    digest = hashlib.sha1(password.encode("utf-8")).digest()
+
+    # Bloom filter first: most strong passwords stop here
+    bloom, bits = index["bloom"], index["bits"]
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:16], "little") | 1
+    for i in range(index["hashes"]):
+        position = (h1 + i * h2) % (1 << 64) % bits
+        if not bloom[24 + (position >> 3)] >> (position & 7) & 1:
+            return False
+
+    # Possible hit: confirm with a binary search over the sorted digests
+    digests = index["digests"]
+    if digests is None:
+        return False
+    low, high = 0, len(digests) // 20
+    while low < high:
+        mid = (low + high) // 2
+        if digests[mid * 20:mid * 20 + 20] < digest:
+            low = mid + 1
+        else:
+            high = mid
+    return digests[low * 20:low * 20 + 20] == digest
+
+
+def audit_range(path, start, end):
+    # Lines belong to the chunk they start in, so neighbouring chunks never overlap
+    with open(path, "rb") as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()
+        data = f.read(max(end - f.tell(), 0))
+        if data and not data.endswith(b"\n"):
+            data += f.readline()
+    if data and not data.endswith(b"\n"):
+        data += b"\n"
+
+    buf = np.frombuffer(data, np.uint8)
+    newlines = np.flatnonzero(buf == 10)
+    starts = np.concatenate(([0], newlines[:-1] + 1))
+    lengths = newlines - starts
+    if len(buf):
+        lengths -= (buf[newlines - 1] == 13) & (lengths > 0)  # \r\n line endings
+        bits = np.bitwise_or.reduceat(BYTE_CLASS[buf], starts)
+        bits[lengths == 0] = 0  # reduceat gives the next byte for empty lines
+    else:
+        bits = np.zeros(0, dtype=np.uint8)
+
+    masks = MISSING_BY_BITS[bits & 15] | np.where(lengths < 8, TOO_SHORT, 0).astype(np.uint8)
+    lines = data.split(b"\n")
+    for i in np.flatnonzero(bits & 16):
+        masks[i] = password_issues(lines[i].rstrip(b"\r").decode("utf-8", "surrogateescape"))
+
+    mask_counts = np.bincount(masks, minlength=32)
+    counts = {bit: int(mask_counts[[m for m in range(32) if m & bit]].sum()) for bit in ISSUES}
+    failing = [lines[i].rstrip(b"\r") for i in np.flatnonzero(masks)]
+    return len(newlines), counts, failing
+
+
+def audit_file(path, weak_path=None, workers=1, chunk_size=AUDIT_CHUNK):
+    # Streams the dump in byte ranges; weak passwords are written out in file order
+    size = os.path.getsize(path)
+    ranges = [(path, start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+    total = 0
+    counts = dict.fromkeys(ISSUES, 0)
+    weak = 0
+
+    out = open(weak_path, "wb") if weak_path else None
+    try:
+        if workers > 1:
+            pool = Pool(workers)
+            results = pool.imap(audit_chunk, ranges)
+        else:
+            pool = None
+            results = map(audit_chunk, ranges)
+        for chunk_total, chunk_counts, failing in results:
+            total += chunk_total
+            weak += len(failing)
+            for bit, count in chunk_counts.items():
+                counts[bit] += count
+            if out:
+                out.write(b"".join(line + b"\n" for line in failing))
+        if pool:
+            pool.close()
+            pool.join()
+    finally:
+        if out:
+            out.close()
+
+    return total, weak, {ISSUES[bit]: count for bit, count in counts.items()}
+
+
+def audit_chunk(args):
+    return audit_range(*args)
+
+
+def random_indices(count, size):
+    # Unbiased: draws at or past the largest multiple of `size` are dropped
+    # rather than folded with %, and os.urandom is asked for whole batches.
+    # One byte per draw while size fits in a byte, otherwise two or four.
+    dtype = np.uint8 if size <= 2 ** 8 else np.uint16 if size <= 2 ** 16 else np.uint32
+    span = 2 ** (8 * np.dtype(dtype).itemsize)
+    limit = span // size * size
+    out = np.empty(count, dtype=dtype)
+    filled = 0
+    while filled < count:
+        need = count - filled
+        raw = np.frombuffer(os.urandom((need * span // limit + 64) * np.dtype(dtype).itemsize), dtype)
+        raw = raw[raw < limit][:need]
+        out[filled:filled + len(raw)] = raw % size
+        filled += len(raw)
+    return out
+
+
+def generate_passwords(count, length=12):
+    # Every password passes check_password_strength by construction: fill all
+    # positions from the full alphabet, then overwrite four distinct random
+    # positions with one character from each required class
+    if length < 8:
+        raise ValueError("Passwords must be at least 8 characters long")
+    classes = [string.ascii_lowercase, string.ascii_uppercase, string.digits, string.punctuation]
+    alphabet = np.frombuffer("".join(classes).encode(), np.uint8)
+    passwords = alphabet[random_indices(count * length, len(alphabet))].reshape(count, length)
+
+    # Four steps of a Fisher-Yates shuffle per row give four distinct,
+    # uniformly chosen positions from just four random bytes
+    rows = np.arange(count)
+    order = np.tile(np.arange(length, dtype=np.uint8 if length <= 256 else np.int64), (count, 1))
+    for step in range(len(classes)):
+        swap = step + random_indices(count, length - step)
+        order[rows, step], order[rows, swap] = order[rows, swap], order[rows, step].copy()
+    for column, chars in enumerate(classes):
+        chars = np.frombuffer(chars.encode(), np.uint8)
+        passwords[rows, order[:, column]] = chars[random_indices(count, len(chars))]
+
+    # A newline column lets one C-level split cut the block into strings
+    lines = np.hstack([passwords, np.full((count, 1), ord("\n"), np.uint8)])
+    return lines.tobytes().decode("ascii").split("\n")[:-1]
+
+
 def generate_strong_password(length=12):
-    chars = string.ascii_letters + string.digits + string.punctuation
-    return "".join(random.choice(chars) for _ in range (length))
-
-password = getpass.getpass("Enter a password: ")
-issues = check_password_strength(password)
-
-if not issues:
-    print("Strong password! you are good to go")
-else:
-    print("Youn got weak password")
-    for issue in issues:
-        print(f"- {issue}")
-
-suggestion = generate_strong_password()
-print("\nSuggesting you a strong password")
-print(suggestion)
\ No newline at end of file
+    return generate_passwords(1, length)[0]
+
+
+def main():
+    load_breach_index()
+    password = getpass.getpass("Enter a password: ")
+    issues = check_password_strength(password)
+
+    if not issues:
+        print("Strong password! you are good to go")
+    else:
+        print("Youn got weak password")
+        for issue in issues:
+            print(f"- {issue}")
+
+    suggestion = generate_strong_password()
+    print("\nSuggesting you a strong password")
+    print(suggestion)
+
+
+def audit_main(path):
+    # python day8.py --audit dump.txt [workers]
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count() or 1
+    weak_path = os.path.splitext(path)[0] + "_weak.txt"
+    total, weak, counts = audit_file(path, weak_path, workers)
+    print(f"Checked {total:,} passwords, {weak:,} weak (listed in {weak_path})")
+    for issue, count in counts.items():
+        print(f"- {issue}: {count:,}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--audit":
+        audit_main(sys.argv[2])
+    elif len(sys.argv) > 2 and sys.argv[1] == "--build-breach-index":
+        # python day8.py --build-breach-index pwned-passwords-sha1.txt
+        count = build_breach_index(sys.argv[2])
+        print(f"Indexed {count:,} breached password hashes")
+    elif len(sys.argv) > 2 and sys.argv[1] == "--generate":
+        # python day8.py --generate 1000000 [length] > passwords.txt
+        length = int(sys.argv[3]) if len(sys.argv) > 3 else 12
+        remaining = int(sys.argv[2])
+        while remaining:
+            batch = generate_passwords(min(remaining, 1_000_000), length)
+            sys.stdout.write("\n".join(batch) + "\n")
+            remaining -= len(batch)
+    else:
+        main()
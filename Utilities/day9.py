@@ -13,23 +13,134 @@ Bonus:
 - Prevent negative or non-integer inputs
 """
 
+import sys
 import time
-while True:
-    try:
-        second = int(input("⏰ Enter the time in seconds: "))
-        if second < 1:
-            print("Please enter a number greater than 0")
-            continue
-        break
-    except ValueError:
-        print("Invalid input, please enter a whole number")
-
-print("\n 🔔 Timer started...")
-for remaining in range(second, 0, -1):
-    mins, secs = divmod(remaining, 60)
-    time_format = f"{mins:02}:{secs:02}"
-    print(f"⏰ Time left: {time_format} ", end ="\r")
-    time.sleep(1)
-
-print("\n Time's up! Take a break or move on to next task.")
-print("\a")
+import heapq
+import random
+
+STATUS_TIMERS = 3  # timers shown on the status line; the rest are summarised
+
+
+def format_remaining(seconds):
+    mins, secs = divmod(max(int(seconds + 0.999), 0), 60)
+    return f"{mins:02}:{secs:02}"
+
+
+def status_line(deadlines, now):
+    soonest = heapq.nsmallest(STATUS_TIMERS, deadlines)
+    parts = [f"{name} {format_remaining(deadline - now)}" for deadline, name in soonest]
+    if len(deadlines) > STATUS_TIMERS:
+        parts.append(f"+{len(deadlines) - STATUS_TIMERS} more")
+    return "⏰ " + " | ".join(parts)
+
+
+def run_timers(durations, tick=1.0, clock=time.monotonic, sleep=time.sleep, show=True):
+    # Every wakeup is computed from absolute deadlines fixed at the start, so
+    # time spent printing never pushes later ticks or timers back. Returns how
+    # late each timer fired, in seconds.
+    start = clock()
+    deadlines = [(start + seconds, name) for name, seconds in durations.items()]
+    heapq.heapify(deadlines)
+    lateness = {}
+    next_tick = start
+
+    while deadlines:
+        wake = min(deadlines[0][0], next_tick)
+        delay = wake - clock()
+        if delay > 0:
+            sleep(delay)
+        now = clock()
+
+        while deadlines and deadlines[0][0] <= now:
+            deadline, name = heapq.heappop(deadlines)
+            lateness[name] = now - deadline
+            if show:
+                print(f"\n 🔔 {name}: Time's up! Take a break or move on to next task.\a")
+
+        if now >= next_tick:
+            # One redraw per tick, however many timers are running
+            if show and deadlines:
+                print(status_line(deadlines, now).ljust(60), end="\r", flush=True)
+            next_tick = start + (int((now - start) / tick) + 1) * tick
+    return lateness
+
+
+def drift_check():
+    # 1) A one-hour timer on a simulated clock where every look at the clock
+    #    costs up to 2 ms of work (printing, other timers). A sleep(1) loop
+    #    would end up seconds late; absolute deadlines keep it within one step.
+    rng = random.Random(0)
+    fake = {"now": 0.0}
+
+    def fake_clock():
+        fake["now"] += rng.uniform(0, 0.002)
+        return fake["now"]
+
+    def fake_sleep(seconds):
+        fake["now"] += seconds
+
+    late = run_timers({"1 hour": 3600}, clock=fake_clock, sleep=fake_sleep, show=False)
+    print(f"1-hour timer, simulated 0-2 ms per clock read: {late['1 hour'] * 1000:.2f} ms late")
+    ok = late["1 hour"] < 0.005
+
+    # 2) 10,000 timers over five seconds on a clock that only moves with the
+    #    CPU time this process really spends plus the time it asks to sleep.
+    #    Lateness is then the scheduler's own overhead (heap work, status
+    #    lines), free of OS wakeup latency, so the result does not depend on
+    #    how busy the machine is.
+    durations = {f"timer {i}": rng.uniform(0.5, 5.0) for i in range(10_000)}
+    cpu = {"start": time.process_time(), "slept": 0.0}
+
+    def cpu_clock():
+        return time.process_time() - cpu["start"] + cpu["slept"]
+
+    def cpu_sleep(seconds):
+        cpu["slept"] += seconds
+
+    late = sorted(run_timers(durations, clock=cpu_clock, sleep=cpu_sleep, show=False).values())
+    p99 = late[int(len(late) * 0.99)]
+    print(f"10,000 timers, scheduler overhead only: 99% within {p99 * 1000:.2f} ms, "
+          f"worst {late[-1] * 1000:.2f} ms late")
+    ok = ok and late[-1] < 0.005
+
+    # 3) For information only: real sleeps add the OS wakeup latency on top,
+    #    which depends on the machine's load and is not this scheduler's doing
+    durations = {f"timer {i}": rng.uniform(0.2, 1.0) for i in range(1_000)}
+    late = sorted(run_timers(durations, show=False).values())
+    print(f"1,000 real timers (OS wakeup included): median {late[len(late) // 2] * 1000:.2f} ms, "
+          f"p99 {late[int(len(late) * 0.99)] * 1000:.2f} ms late")
+    return ok
+
+
+def ask_timers():
+    timers = {}
+    while True:
+        name = input("⏰ Timer name (press Enter to start): ").strip()
+        if not name:
+            if timers:
+                return timers
+            name = "Timer"
+        while True:
+            try:
+                second = int(input(f"⏰ Enter the time in seconds for {name}: "))
+                if second < 1:
+                    print("Please enter a number greater than 0")
+                    continue
+                break
+            except ValueError:
+                print("Invalid input, please enter a whole number")
+        timers[name] = second
+
+
+def main():
+    timers = ask_timers()
+    print("\n 🔔 Timer started...")
+    run_timers(timers)
+    print("\a")
+
+
+if __name__ == "__main__":
+    if "--drift-check" in sys.argv:
+        sys.exit(0 if drift_check() else 1)
+    else:
+        main()